@@ -0,0 +1,29 @@
+import Foundation
+
+// MARK: - ProgressionPoint
+
+/// One workout file's summary for an exercise.
+/// Written by `backfill_last_weights.py --progression` to `.obsidian/progression.json`.
+struct ProgressionPoint: Codable {
+    var date: String        // ISO date string e.g. "2026-02-13"
+    var file: String        // workout filename the point was summarized from
+    var maxWeight: Double?  // same rule as MarkdownParser.parseSets; nil = bodyweight-only session
+    var maxReps: Int
+    var totalReps: Int
+    var sets: Int
+}
+
+// MARK: - ProgressionCache
+
+/// Precomputed per-exercise history, so a progression chart is one file read.
+/// `through` is the newest workout date the cache covers; files dated on or
+/// after it may have changed since and are parsed directly.
+/// Version 2: `maxWeight` is parsed like MarkdownParser.parseSets, so cached
+/// and freshly parsed points plot on the same scale (version 1 stored pounds).
+struct ProgressionCache: Codable {
+    static let supportedVersion = 2
+
+    var version: Int
+    var through: String?
+    var exercises: [String: [ProgressionPoint]]
+}
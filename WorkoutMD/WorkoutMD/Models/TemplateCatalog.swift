@@ -0,0 +1,34 @@
+import Foundation
+
+// MARK: - TemplateCatalog
+
+/// Every `w-*-t.md` template, pre-parsed by `compile_templates.py` into
+/// `.obsidian/templates.json`, so the picker loads with one file read.
+struct TemplateCatalog: Codable {
+    static let supportedVersion = 1
+
+    var version: Int
+    var templatesFolder: String
+    var templates: [TemplateCatalogEntry]
+}
+
+struct TemplateCatalogEntry: Codable {
+    var file: String            // e.g. "w-chest-t.md"
+    var slug: String            // e.g. "chest"
+    var displayName: String     // e.g. "Chest"
+    var mtime: Int64            // template's modification time (ns since 1970) when compiled
+    var size: Int
+    var sha256: String
+    var exercises: [TemplateCatalogExercise]
+
+    /// True if the template file hasn't been modified since it was compiled.
+    func isCurrent(modifiedAt date: Date) -> Bool {
+        abs(date.timeIntervalSince1970 - Double(mtime) / 1_000_000_000) < 0.001
+    }
+}
+
+struct TemplateCatalogExercise: Codable {
+    var name: String
+    var video: String?          // vault-relative path, e.g. "videos/chest.mov"
+    var videoExists: Bool
+}
@@ -114,6 +114,16 @@ class VaultService: ObservableObject {
         return FileManager.default.fileExists(atPath: fileURL.path)
     }
 
+    /// Returns the file's modification date, or nil if it can't be read.
+    func modificationDate(relativePath: String) -> Date? {
+        guard let vault = vaultURL else { return nil }
+        let fileURL = vault.appendingPathComponent(relativePath)
+        let accessed = vault.startAccessingSecurityScopedResource()
+        defer { if accessed { vault.stopAccessingSecurityScopedResource() } }
+        let attrs = try? FileManager.default.attributesOfItem(atPath: fileURL.path)
+        return attrs?[.modificationDate] as? Date
+    }
+
     /// Returns file names matching a pattern inside a folder.
     func listFiles(inFolder folder: String, matching predicate: (String) -> Bool) throws -> [String] {
         guard let vault = vaultURL else { throw VaultError.noVaultSelected }
@@ -152,6 +162,38 @@ class VaultService: ObservableObject {
         let content = String(data: data, encoding: .utf8) ?? "{}"
         try writeFile(relativePath: lastWeightsPath, content: content)
     }
+
+    // MARK: - Progression cache (app data)
+
+    private let progressionPath = ".obsidian/progression.json"
+
+    /// Reads the progression cache written by `backfill_last_weights.py --progression`.
+    /// Returns nil if it doesn't exist, can't be decoded, or has an unknown version.
+    func readProgressionCache() -> ProgressionCache? {
+        guard let content = try? readFile(relativePath: progressionPath),
+              let data = content.data(using: .utf8),
+              let cache = try? JSONDecoder().decode(ProgressionCache.self, from: data),
+              cache.version == ProgressionCache.supportedVersion
+        else { return nil }
+        return cache
+    }
+
+    // MARK: - Template catalog (app data)
+
+    private let templateCatalogPath = ".obsidian/templates.json"
+
+    /// Reads the template catalog written by `compile_templates.py`.
+    /// Returns nil if it doesn't exist, can't be decoded, has an unknown
+    /// version, or was compiled for a different templates folder.
+    func readTemplateCatalog() -> TemplateCatalog? {
+        guard let content = try? readFile(relativePath: templateCatalogPath),
+              let data = content.data(using: .utf8),
+              let catalog = try? JSONDecoder().decode(TemplateCatalog.self, from: data),
+              catalog.version == TemplateCatalog.supportedVersion,
+              catalog.templatesFolder == templatesFolder
+        else { return nil }
+        return catalog
+    }
 }
 
 // MARK: - Errors
@@ -73,9 +73,26 @@ struct ExerciseProgressionView: View {
         let dateFmt = DateFormatter()
         dateFmt.dateFormat = "yyyy-MM-dd"
         var points: [ExerciseDataPoint] = []
+
+        // Cached history covers files dated before `through`; anything newer
+        // (e.g. sessions saved since the last backfill) is parsed below. An
+        // exercise the cache doesn't list is parsed from every file.
+        let cache = vaultService.readProgressionCache()
+        let cached = cache?.exercises[exerciseName]
+        let through = cached == nil ? nil : cache?.through
+        if let cached, let through {
+            let existing = Set(files)
+            for pt in cached where pt.date < through && existing.contains(pt.file) {
+                guard let date = dateFmt.date(from: pt.date) else { continue }
+                points.append(ExerciseDataPoint(date: date, maxWeight: pt.maxWeight, maxReps: pt.maxReps))
+            }
+        }
+
         for fileName in files {
-            guard fileName.count > 10,
-                  let date = dateFmt.date(from: String(fileName.prefix(10))),
+            guard fileName.count > 10 else { continue }
+            let dateStr = String(fileName.prefix(10))
+            if let through, dateStr < through { continue }
+            guard let date = dateFmt.date(from: dateStr),
                   let text = try? vaultService.readFile(relativePath: "\(folder)/\(fileName)") else { continue }
             let sets = parser.parseSets(from: text, forExercise: exerciseName)
             guard !sets.isEmpty else { continue }
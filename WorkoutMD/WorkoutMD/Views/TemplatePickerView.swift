@@ -127,9 +127,24 @@ struct TemplatePickerView: View {
             }
 
             let parser = MarkdownParser()
+            // Precompiled entries are used while their file is unmodified;
+            // new or edited templates are parsed from the markdown
+            let catalog = Dictionary(
+                (vaultService.readTemplateCatalog()?.templates ?? []).map { ($0.file, $0) },
+                uniquingKeysWith: { first, _ in first }
+            )
             templates = files.map { fileName -> WorkoutTemplate in
                 let displayName = WorkoutTemplate.displayName(from: fileName)
                 let relativePath = "\(folder)/\(fileName)"
+                if let entry = catalog[fileName],
+                   let modified = vaultService.modificationDate(relativePath: relativePath),
+                   entry.isCurrent(modifiedAt: modified) {
+                    let exercises = entry.exercises.map { ex in
+                        Exercise(name: ex.name,
+                                 videoURL: ex.video.flatMap { vaultService.resolveURL(relativePath: $0) })
+                    }
+                    return WorkoutTemplate(fileName: fileName, displayName: displayName, exercises: exercises)
+                }
                 let text = (try? vaultService.readFile(relativePath: relativePath)) ?? ""
                 let vaultURL = vaultService.vaultURL?
                     .appendingPathComponent(relativePath)
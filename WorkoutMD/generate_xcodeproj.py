@@ -3,12 +3,23 @@
 Generates WorkoutMD.xcodeproj/project.pbxproj for a SwiftUI iOS 17+ app.
 Run from the WorkoutMD/ directory:
     python3 generate_xcodeproj.py
+
+Sources are discovered, not listed: every .swift file and asset catalog
+under WorkoutMD/ is added, with one Xcode group per folder. File, build-file
+and group UUIDs are hashes of the relative path, so regenerating gives the
+same IDs and adding a file only adds lines. project.pbxproj is rewritten
+only when the generated text changes, so Xcode doesn't re-index needlessly.
 """
 
+import hashlib
 import os
+import stat
+import tempfile
+
+SOURCE_ROOT = "WorkoutMD"   # folder (and top-level group) holding the app sources
 
 # ---------------------------------------------------------------------------
-# UUID map (24-char hex, Xcode style)
+# UUID map (24-char hex, Xcode style) — fixed project-level objects
 # ---------------------------------------------------------------------------
 U = {
     "PROJECT":              "11111111111111111111110A",
@@ -26,88 +37,87 @@ U = {
     "DEBUG_CFG_TGT":        "111111111111111111111116",
     "RELEASE_CFG_TGT":      "111111111111111111111117",
     "WORKOUTMD_SRC_GROUP":  "111111111111111111111118",
-    "MODELS_GROUP":         "111111111111111111111119",
-    "VIEWS_GROUP":          "11111111111111111111111A",
-    "SERVICES_GROUP":       "11111111111111111111111B",
-    "SETTINGS_GROUP":       "11111111111111111111111C",
-    # FileReference UUIDs
-    "FR_APP":               "22222222222222222222220A",  # WorkoutMDApp.swift
-    "FR_CONTENT":           "22222222222222222222220B",
-    "FR_TEMPLATE":          "22222222222222222222220C",  # Models/WorkoutTemplate.swift
-    "FR_EXERCISE":          "22222222222222222222220D",
-    "FR_SET":               "22222222222222222222220E",
-    "FR_VAULTSETUP":        "22222222222222222222220F",
-    "FR_TEMPLATEPICKER":    "222222222222222222222210",
-    "FR_SESSION":           "222222222222222222222211",
-    "FR_EXERCISECARD":      "222222222222222222222212",
-    "FR_SETROW":            "222222222222222222222213",
-    "FR_VIDEO":             "222222222222222222222214",
-    "FR_VAULTSERVICE":      "222222222222222222222215",
-    "FR_PARSER":            "222222222222222222222216",
-    "FR_WRITER":            "222222222222222222222217",
-    "FR_SETTINGS":          "222222222222222222222218",
-    "FR_ASSETS":            "222222222222222222222219",
-    "FR_INFOPLIST":         "22222222222222222222221A",
-    "FR_HIKE":              "22222222222222222222221B",
-    "FR_OVERVIEW":          "22222222222222222222221C",
-    "FR_RECOVERY":          "22222222222222222222221D",
-    "FR_LASTWEIGHT":        "22222222222222222222221E",
-    "FR_EXERCISE_PROGRESSION": "22222222222222222222221F",
-    "FR_WORKOUT_DETAIL":       "222222222222222222222220",
-    # BuildFile UUIDs (one per source file)
-    "BF_APP":               "33333333333333333333330A",
-    "BF_CONTENT":           "33333333333333333333330B",
-    "BF_TEMPLATE":          "33333333333333333333330C",
-    "BF_EXERCISE":          "33333333333333333333330D",
-    "BF_SET":               "33333333333333333333330E",
-    "BF_VAULTSETUP":        "33333333333333333333330F",
-    "BF_TEMPLATEPICKER":    "333333333333333333333310",
-    "BF_SESSION":           "333333333333333333333311",
-    "BF_EXERCISECARD":      "333333333333333333333312",
-    "BF_SETROW":            "333333333333333333333313",
-    "BF_VIDEO":             "333333333333333333333314",
-    "BF_VAULTSERVICE":      "333333333333333333333315",
-    "BF_PARSER":            "333333333333333333333316",
-    "BF_WRITER":            "333333333333333333333317",
-    "BF_SETTINGS":          "333333333333333333333318",
-    "BF_ASSETS":            "333333333333333333333319",
-    "BF_HIKE":              "33333333333333333333331A",
-    "BF_OVERVIEW":          "33333333333333333333331B",
-    "BF_RECOVERY":          "33333333333333333333331C",
-    "BF_LASTWEIGHT":        "33333333333333333333331D",
-    "BF_EXERCISE_PROGRESSION": "33333333333333333333331E",
-    "BF_WORKOUT_DETAIL":       "33333333333333333333331F",
 }
 
+
+def path_uuid(kind, rel_path):
+    """Deterministic 24-hex-digit ID for a file/build-file/group at rel_path."""
+    return hashlib.sha1(f"{kind}:{rel_path}".encode("utf-8")).hexdigest()[:24].upper()
+
+
 # ---------------------------------------------------------------------------
-# File definitions
+# Source discovery
 # ---------------------------------------------------------------------------
-SWIFT_FILES = [
-    # (buildfile_key, fileref_key, path_in_project, display_name)
-    ("BF_APP",           "FR_APP",           "WorkoutMD/WorkoutMDApp.swift",            "WorkoutMDApp.swift"),
-    ("BF_CONTENT",       "FR_CONTENT",       "WorkoutMD/ContentView.swift",             "ContentView.swift"),
-    ("BF_TEMPLATE",      "FR_TEMPLATE",      "WorkoutMD/Models/WorkoutTemplate.swift",  "WorkoutTemplate.swift"),
-    ("BF_EXERCISE",      "FR_EXERCISE",      "WorkoutMD/Models/Exercise.swift",         "Exercise.swift"),
-    ("BF_SET",           "FR_SET",           "WorkoutMD/Models/WorkoutSet.swift",       "WorkoutSet.swift"),
-    ("BF_VAULTSETUP",    "FR_VAULTSETUP",    "WorkoutMD/Views/VaultSetupView.swift",    "VaultSetupView.swift"),
-    ("BF_TEMPLATEPICKER","FR_TEMPLATEPICKER","WorkoutMD/Views/TemplatePickerView.swift","TemplatePickerView.swift"),
-    ("BF_SESSION",       "FR_SESSION",       "WorkoutMD/Views/WorkoutSessionView.swift","WorkoutSessionView.swift"),
-    ("BF_EXERCISECARD",  "FR_EXERCISECARD",  "WorkoutMD/Views/ExerciseCardView.swift",  "ExerciseCardView.swift"),
-    ("BF_SETROW",        "FR_SETROW",        "WorkoutMD/Views/SetRowView.swift",        "SetRowView.swift"),
-    ("BF_VIDEO",         "FR_VIDEO",         "WorkoutMD/Views/VideoPlayerView.swift",   "VideoPlayerView.swift"),
-    ("BF_VAULTSERVICE",  "FR_VAULTSERVICE",  "WorkoutMD/Services/VaultService.swift",   "VaultService.swift"),
-    ("BF_PARSER",        "FR_PARSER",        "WorkoutMD/Services/MarkdownParser.swift", "MarkdownParser.swift"),
-    ("BF_WRITER",        "FR_WRITER",        "WorkoutMD/Services/MarkdownWriter.swift", "MarkdownWriter.swift"),
-    ("BF_SETTINGS",      "FR_SETTINGS",      "WorkoutMD/Settings/SettingsView.swift",   "SettingsView.swift"),
-    ("BF_HIKE",          "FR_HIKE",          "WorkoutMD/Views/HikeSessionView.swift",   "HikeSessionView.swift"),
-    ("BF_OVERVIEW",      "FR_OVERVIEW",      "WorkoutMD/Views/OverviewView.swift",      "OverviewView.swift"),
-    ("BF_RECOVERY",      "FR_RECOVERY",      "WorkoutMD/Views/RecoverySessionView.swift","RecoverySessionView.swift"),
-    ("BF_LASTWEIGHT",    "FR_LASTWEIGHT",    "WorkoutMD/Models/LastWeight.swift",             "LastWeight.swift"),
-    ("BF_EXERCISE_PROGRESSION", "FR_EXERCISE_PROGRESSION", "WorkoutMD/Views/ExerciseProgressionView.swift", "ExerciseProgressionView.swift"),
-    ("BF_WORKOUT_DETAIL",       "FR_WORKOUT_DETAIL",       "WorkoutMD/Views/WorkoutDetailView.swift",        "WorkoutDetailView.swift"),
-]
-
-def pbxproj():
+FILE_TYPES = {
+    ".swift":    "sourcecode.swift",
+    ".xcassets": "folder.assetcatalog",
+}
+
+
+class SourceFile:
+    def __init__(self, rel_path):
+        self.rel_path = rel_path                       # e.g. WorkoutMD/Views/SetRowView.swift
+        self.name = os.path.basename(rel_path)
+        self.file_type = FILE_TYPES[os.path.splitext(rel_path)[1]]
+        self.uuid = path_uuid("file", rel_path)
+        self.build_uuid = path_uuid("build", rel_path)
+
+
+class Group:
+    def __init__(self, rel_path, uuid=None):
+        self.rel_path = rel_path
+        self.name = os.path.basename(rel_path)
+        self.uuid = uuid or path_uuid("group", rel_path)
+        self.files = []       # SourceFile, sorted by name
+        self.groups = []      # Group, sorted by name
+
+
+class Sources:
+    def __init__(self, root_group):
+        self.root = root_group
+        self.swift_files = []
+        self.resources = []
+
+    def all_groups(self):
+        pending = [self.root]
+        while pending:
+            group = pending.pop(0)
+            yield group
+            pending.extend(group.groups)
+
+
+def discover_sources(project_dir):
+    """
+    Walk project_dir/SOURCE_ROOT for .swift files and .xcassets catalogs
+    (catalogs are leaves — their contents belong to Xcode). Hidden folders
+    and folders without any source are skipped.
+    """
+    root = Group(SOURCE_ROOT, U["WORKOUTMD_SRC_GROUP"])
+    sources = Sources(root)
+
+    def walk(group):
+        with os.scandir(os.path.join(project_dir, group.rel_path)) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            rel_path = f"{group.rel_path}/{entry.name}"
+            ext = os.path.splitext(entry.name)[1]
+            if entry.is_dir() and ext != ".xcassets":
+                child = Group(rel_path)
+                walk(child)
+                if child.files or child.groups:
+                    group.groups.append(child)
+            elif ext in FILE_TYPES:
+                f = SourceFile(rel_path)
+                group.files.append(f)
+                (sources.swift_files if ext == ".swift" else sources.resources).append(f)
+
+    walk(root)
+    return sources
+
+
+def pbxproj(sources):
     lines = []
     a = lines.append
 
@@ -122,23 +132,21 @@ def pbxproj():
 
     # ---- PBXBuildFile section ----
     a("/* Begin PBXBuildFile section */")
-    for bf_key, fr_key, path, name in SWIFT_FILES:
-        a(f"\t\t{U[bf_key]} /* {name} in Sources */ = {{isa = PBXBuildFile; fileRef = {U[fr_key]} /* {name} */; }};")
-    # Assets resource
-    a(f"\t\t{U['BF_ASSETS']} /* Assets.xcassets in Resources */ = {{isa = PBXBuildFile; fileRef = {U['FR_ASSETS']} /* Assets.xcassets */; }};")
+    for f in sources.swift_files:
+        a(f"\t\t{f.build_uuid} /* {f.name} in Sources */ = {{isa = PBXBuildFile; fileRef = {f.uuid} /* {f.name} */; }};")
+    for f in sources.resources:
+        a(f"\t\t{f.build_uuid} /* {f.name} in Resources */ = {{isa = PBXBuildFile; fileRef = {f.uuid} /* {f.name} */; }};")
     a("/* End PBXBuildFile section */")
     a("")
 
     # ---- PBXFileReference section ----
     a("/* Begin PBXFileReference section */")
-    # .app product — uses APP_PRODUCT uuid, not FR_APP
+    # .app product — uses APP_PRODUCT uuid
     a(f"\t\t{U['APP_PRODUCT']} /* WorkoutMD.app */ = {{isa = PBXFileReference; explicitFileType = wrapper.application; includeInIndex = 0; path = WorkoutMD.app; sourceTree = BUILT_PRODUCTS_DIR; }};")
-    for bf_key, fr_key, path, name in SWIFT_FILES:
+    for f in sources.swift_files + sources.resources:
         # path is relative to its parent group, which is already set via group `path` key.
         # So just use the filename here.
-        a(f"\t\t{U[fr_key]} /* {name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {name}; sourceTree = \"<group>\"; }};")
-    # Assets
-    a(f"\t\t{U['FR_ASSETS']} /* Assets.xcassets */ = {{isa = PBXFileReference; lastKnownFileType = folder.assetcatalog; path = Assets.xcassets; sourceTree = \"<group>\"; }};")
+        a(f"\t\t{f.uuid} /* {f.name} */ = {{isa = PBXFileReference; lastKnownFileType = {f.file_type}; path = {f.name}; sourceTree = \"<group>\"; }};")
     a("/* End PBXFileReference section */")
     a("")
 
@@ -161,7 +169,7 @@ def pbxproj():
     a(f"\t\t{U['MAIN_GROUP']} = {{")
     a("\t\t\tisa = PBXGroup;")
     a("\t\t\tchildren = (")
-    a(f"\t\t\t\t{U['WORKOUTMD_SRC_GROUP']} /* WorkoutMD */,")
+    a(f"\t\t\t\t{sources.root.uuid} /* {sources.root.name} */,")
     a(f"\t\t\t\t{U['PRODUCTS_GROUP']} /* Products */,")
     a("\t\t\t);")
     a("\t\t\tsourceTree = \"<group>\";")
@@ -177,40 +185,24 @@ def pbxproj():
     a("\t\t\tsourceTree = \"<group>\";")
     a("\t\t};")
 
-    # WorkoutMD source group (top-level files + subgroups)
-    top_level = [f for f in SWIFT_FILES if f[2].count("/") == 1]  # WorkoutMD/Foo.swift
-    a(f"\t\t{U['WORKOUTMD_SRC_GROUP']} /* WorkoutMD */ = {{")
-    a("\t\t\tisa = PBXGroup;")
-    a("\t\t\tchildren = (")
-    for bf_key, fr_key, path, name in top_level:
-        a(f"\t\t\t\t{U[fr_key]} /* {name} */,")
-    a(f"\t\t\t\t{U['MODELS_GROUP']} /* Models */,")
-    a(f"\t\t\t\t{U['VIEWS_GROUP']} /* Views */,")
-    a(f"\t\t\t\t{U['SERVICES_GROUP']} /* Services */,")
-    a(f"\t\t\t\t{U['SETTINGS_GROUP']} /* Settings */,")
-    a(f"\t\t\t\t{U['FR_ASSETS']} /* Assets.xcassets */,")
-    a("\t\t\t);")
-    a("\t\t\tpath = WorkoutMD;")
-    a("\t\t\tsourceTree = \"<group>\";")
-    a("\t\t};")
-
-    def subgroup(group_key, folder_name, prefix):
-        files = [f for f in SWIFT_FILES if f[2].startswith(f"WorkoutMD/{folder_name}/")]
-        a(f"\t\t{U[group_key]} /* {folder_name} */ = {{")
+    # One group per source folder: Swift files, then subfolders, then catalogs
+    for group in sources.all_groups():
+        swift = [f for f in group.files if f.file_type == "sourcecode.swift"]
+        other = [f for f in group.files if f.file_type != "sourcecode.swift"]
+        a(f"\t\t{group.uuid} /* {group.name} */ = {{")
         a("\t\t\tisa = PBXGroup;")
         a("\t\t\tchildren = (")
-        for bf_key, fr_key, path, name in files:
-            a(f"\t\t\t\t{U[fr_key]} /* {name} */,")
+        for f in swift:
+            a(f"\t\t\t\t{f.uuid} /* {f.name} */,")
+        for sub in group.groups:
+            a(f"\t\t\t\t{sub.uuid} /* {sub.name} */,")
+        for f in other:
+            a(f"\t\t\t\t{f.uuid} /* {f.name} */,")
         a("\t\t\t);")
-        a(f"\t\t\tpath = {folder_name};")
+        a(f"\t\t\tpath = {group.name};")
         a("\t\t\tsourceTree = \"<group>\";")
         a("\t\t};")
 
-    subgroup("MODELS_GROUP",   "Models",   "BF_")
-    subgroup("VIEWS_GROUP",    "Views",    "BF_")
-    subgroup("SERVICES_GROUP", "Services", "BF_")
-    subgroup("SETTINGS_GROUP", "Settings", "BF_")
-
     a("/* End PBXGroup section */")
     a("")
 
@@ -275,7 +267,8 @@ def pbxproj():
     a("\t\t\tisa = PBXResourcesBuildPhase;")
     a("\t\t\tbuildActionMask = 2147483647;")
     a("\t\t\tfiles = (")
-    a(f"\t\t\t\t{U['BF_ASSETS']} /* Assets.xcassets in Resources */,")
+    for f in sources.resources:
+        a(f"\t\t\t\t{f.build_uuid} /* {f.name} in Resources */,")
     a("\t\t\t);")
     a("\t\t\trunOnlyForDeploymentPostprocessing = 0;")
     a("\t\t};")
@@ -288,8 +281,8 @@ def pbxproj():
     a("\t\t\tisa = PBXSourcesBuildPhase;")
     a("\t\t\tbuildActionMask = 2147483647;")
     a("\t\t\tfiles = (")
-    for bf_key, fr_key, path, name in SWIFT_FILES:
-        a(f"\t\t\t\t{U[bf_key]} /* {name} in Sources */,")
+    for f in sources.swift_files:
+        a(f"\t\t\t\t{f.build_uuid} /* {f.name} in Sources */,")
     a("\t\t\t);")
     a("\t\t\trunOnlyForDeploymentPostprocessing = 0;")
     a("\t\t};")
@@ -417,19 +410,37 @@ def pbxproj():
     return "\n".join(lines)
 
 
-if __name__ == "__main__":
-    out_dir = os.path.join(os.path.dirname(__file__), "WorkoutMD.xcodeproj")
-    os.makedirs(out_dir, exist_ok=True)
-    pbx_path = os.path.join(out_dir, "project.pbxproj")
-    with open(pbx_path, "w") as f:
-        f.write(pbxproj())
-    print(f"Written: {pbx_path}")
-
-    # workspace contents
-    ws_dir = os.path.join(out_dir, "project.xcworkspace")
-    os.makedirs(ws_dir, exist_ok=True)
-    ws_path = os.path.join(ws_dir, "contents.xcworkspacedata")
-    ws_content = """<?xml version="1.0" encoding="UTF-8"?>
+def write_if_changed(path, content):
+    """
+    Atomically write content to path unless it already holds exactly that,
+    keeping the file's permissions (new files get 0666 minus umask).
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".generate-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+WORKSPACE_CONTENTS = """<?xml version="1.0" encoding="UTF-8"?>
 <Workspace
    version = "1.0">
    <FileRef
@@ -437,6 +448,18 @@ if __name__ == "__main__":
    </FileRef>
 </Workspace>
 """
-    with open(ws_path, "w") as f:
-        f.write(ws_content)
-    print(f"Written: {ws_path}")
+
+
+if __name__ == "__main__":
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    sources = discover_sources(project_dir)
+    out_dir = os.path.join(project_dir, "WorkoutMD.xcodeproj")
+
+    pbx_path = os.path.join(out_dir, "project.pbxproj")
+    ws_path = os.path.join(out_dir, "project.xcworkspace", "contents.xcworkspacedata")
+    for path, content in ((pbx_path, pbxproj(sources)), (ws_path, WORKSPACE_CONTENTS)):
+        if write_if_changed(path, content):
+            print(f"Written: {path}")
+        else:
+            print(f"Unchanged: {path}")
+    print(f"{len(sources.swift_files)} Swift files, {len(sources.resources)} asset catalogs")
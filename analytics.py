@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+analytics.py
+
+Weekly training summaries from the vault's workouts/ folder: tonnage, sets
+per muscle group, personal records per exercise and session frequency.
+
+Files are streamed oldest → newest in one pass and folded into running
+accumulators: the current ISO week (emitted as soon as a later week starts)
+plus one small record per exercise. No set history is kept in memory.
+
+Only completed (`- [x]`) sets count. Tonnage is weight × reps over sets
+with a numeric weight; bodyweight sets count toward sets and reps only.
+A set counts once toward every `muscles:` entry in its file's frontmatter.
+Exercises are grouped by canonical name (see exercise_aliases.py), so
+"chest press" and "Chest Press" share one PR record.
+
+Usage:
+    python3 analytics.py [vault_path] [--report all|weekly|muscles|prs|frequency]
+        [--format json|csv] [--output PATH] [--recursive]
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import csv
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from backfill_last_weights import (
+    DEFAULT_VAULT,
+    WORKOUTS_FOLDER,
+    ExerciseNames,
+    iter_set_lines,
+    numeric_weight,
+    load_exercise_names,
+    read_frontmatter,
+    dedupe_workout_files,
+    scan_workout_files,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+REPORTS = ("all", "weekly", "muscles", "prs", "frequency")
+
+# ── Accumulators ──────────────────────────────────────────────────────────────
+
+@dataclass
+class WeekSummary:
+    week: str                   # ISO week, e.g. "2026-W07"
+    start: str                  # Monday of that week
+    sessions: int = 0
+    sets: int = 0
+    reps: int = 0
+    tonnage: float = 0.0
+    duration: int = 0           # minutes, from frontmatter `duration` / `time`
+    effort_total: int = 0
+    effort_count: int = 0
+    muscle_sets: dict[str, int] = field(default_factory=dict)
+    muscle_tonnage: dict[str, float] = field(default_factory=dict)
+
+    def row(self) -> dict:
+        """Flat weekly row (muscle breakdown lives in the muscles report)."""
+        return {
+            "week": self.week,
+            "start": self.start,
+            "sessions": self.sessions,
+            "sets": self.sets,
+            "reps": self.reps,
+            "tonnage": round(self.tonnage, 1),
+            "duration": self.duration,
+            "effortAvg": round(self.effort_total / self.effort_count, 1) if self.effort_count else None,
+        }
+
+    def muscle_rows(self) -> list[dict]:
+        return [
+            {"week": self.week, "muscle": muscle, "sets": sets,
+             "tonnage": round(self.muscle_tonnage.get(muscle, 0.0), 1)}
+            for muscle, sets in sorted(self.muscle_sets.items())
+        ]
+
+
+@dataclass
+class ExerciseRecord:
+    """Personal records and frequency for one exercise, updated per session."""
+    exercise: str
+    sessions: int = 0
+    first_date: str = ""
+    last_date: str = ""
+    max_weight: float | None = None
+    max_weight_reps: int = 0
+    max_weight_date: str = ""
+    max_reps: int = 0
+    max_reps_date: str = ""
+    best_e1rm: float | None = None    # Epley: weight × (1 + reps / 30)
+    best_e1rm_date: str = ""
+
+    def pr_row(self) -> dict:
+        return {
+            "exercise": self.exercise,
+            "maxWeight": self.max_weight,
+            "maxWeightReps": self.max_weight_reps or None,
+            "maxWeightDate": self.max_weight_date or None,
+            "maxReps": self.max_reps,
+            "maxRepsDate": self.max_reps_date or None,
+            "bestE1RM": None if self.best_e1rm is None else round(self.best_e1rm, 1),
+            "bestE1RMDate": self.best_e1rm_date or None,
+        }
+
+    def frequency_row(self) -> dict:
+        span = (date.fromisoformat(self.last_date) - date.fromisoformat(self.first_date)).days
+        return {
+            "exercise": self.exercise,
+            "sessions": self.sessions,
+            "firstDate": self.first_date,
+            "lastDate": self.last_date,
+            "avgDaysBetween": round(span / (self.sessions - 1), 1) if self.sessions > 1 else None,
+        }
+
+
+def _int_field(meta: dict, *keys: str) -> int:
+    for key in keys:
+        value = meta.get(key)
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+    return 0
+
+
+class VaultAnalytics:
+    """
+    Running aggregates fed one workout file at a time, oldest first.
+    Memory is one open week plus one ExerciseRecord per distinct exercise.
+    """
+
+    def __init__(self, names: ExerciseNames | None = None):
+        self.names = names or ExerciseNames()
+        self.week: WeekSummary | None = None
+        self.records: dict[str, ExerciseRecord] = {}
+        self.sessions = 0
+        self.training_days = 0
+        self.first_date: str | None = None
+        self.last_date: str | None = None
+
+    def add_file(self, path: Path, date_str: str) -> WeekSummary | None:
+        """
+        Fold one workout file in. Returns the previous week's finished
+        summary when this file is the first of a new ISO week.
+        """
+        day = date.fromisoformat(date_str)
+        year, week_no, weekday = day.isocalendar()
+        key = f"{year}-W{week_no:02d}"
+        finished = None
+        if self.week is None or self.week.week != key:
+            finished = self.week
+            self.week = WeekSummary(key, (day - timedelta(days=weekday - 1)).isoformat())
+        week = self.week
+
+        if date_str != self.last_date:
+            self.training_days += 1
+        self.first_date = self.first_date or date_str
+        self.last_date = date_str
+        self.sessions += 1
+        week.sessions += 1
+
+        with open(path, encoding="utf-8") as f:
+            meta = read_frontmatter(f)
+            muscles = meta.get("muscles")
+            muscles = muscles if isinstance(muscles, list) else []
+            effort = _int_field(meta, "effort")
+            if effort:
+                week.effort_total += effort
+                week.effort_count += 1
+            week.duration += _int_field(meta, "duration", "time")
+
+            seen = set()
+            canonical = self.names.canonical
+            for name, weight, reps, done in iter_set_lines(f):
+                if not done:
+                    continue
+                name = canonical(name)
+                value = numeric_weight(weight)
+                volume = value * reps if value is not None else 0.0
+                week.sets += 1
+                week.reps += reps
+                week.tonnage += volume
+                for muscle in muscles:
+                    week.muscle_sets[muscle] = week.muscle_sets.get(muscle, 0) + 1
+                    week.muscle_tonnage[muscle] = week.muscle_tonnage.get(muscle, 0.0) + volume
+
+                record = self.records.get(name)
+                if record is None:
+                    record = self.records[name] = ExerciseRecord(name, first_date=date_str)
+                if name not in seen:
+                    seen.add(name)
+                    record.sessions += 1
+                    record.last_date = date_str
+                if reps > record.max_reps:
+                    record.max_reps, record.max_reps_date = reps, date_str
+                if value is not None:
+                    if (record.max_weight is None or value > record.max_weight
+                            or (value == record.max_weight and reps > record.max_weight_reps)):
+                        record.max_weight, record.max_weight_reps = value, reps
+                        record.max_weight_date = date_str
+                    e1rm = value * (1 + reps / 30)
+                    if record.best_e1rm is None or e1rm > record.best_e1rm:
+                        record.best_e1rm, record.best_e1rm_date = e1rm, date_str
+        return finished
+
+    def close(self) -> WeekSummary | None:
+        """Finish and return the open week (None if no files were added)."""
+        week, self.week = self.week, None
+        return week
+
+    def summary(self) -> dict:
+        weeks = 0
+        if self.first_date:
+            span = date.fromisoformat(self.last_date) - date.fromisoformat(self.first_date)
+            weeks = span.days / 7 + 1
+        return {
+            "sessions": self.sessions,
+            "trainingDays": self.training_days,
+            "firstDate": self.first_date,
+            "lastDate": self.last_date,
+            "sessionsPerWeek": round(self.sessions / weeks, 2) if weeks else None,
+        }
+
+
+def iter_weeks(
+    analytics: VaultAnalytics, workouts_dir: Path, recursive: bool = False
+) -> Iterator[WeekSummary]:
+    """Stream every workout file through `analytics`, yielding each finished week."""
+    scanned, _ = dedupe_workout_files(scan_workout_files(workouts_dir, recursive))
+    for date_str, path, _ in scanned:
+        finished = analytics.add_file(path, date_str)
+        if finished is not None:
+            yield finished
+    last = analytics.close()
+    if last is not None:
+        yield last
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def write_csv(out, rows: Iterator[dict]) -> int:
+    writer = None
+    count = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(out, fieldnames=list(row), lineterminator="\n")
+            writer.writeheader()
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def report_rows(
+    report: str, analytics: VaultAnalytics, weeks: Iterator[WeekSummary]
+) -> Iterator[dict]:
+    """Rows for one report. Weekly/muscle rows stream as weeks finish."""
+    if report == "weekly":
+        for week in weeks:
+            yield week.row()
+    elif report == "muscles":
+        for week in weeks:
+            yield from week.muscle_rows()
+    else:
+        for _ in weeks:     # drain: records are complete only after the last file
+            pass
+        records = sorted(analytics.records.values(), key=lambda r: r.exercise)
+        for record in records:
+            yield record.pr_row() if report == "prs" else record.frequency_row()
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Weekly tonnage, muscle sets, PRs and frequency from workout files."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--report", choices=REPORTS, default="all",
+                        help="which table to produce (default: all, JSON only)")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--output", "-o", type=Path, metavar="PATH",
+                        help="write here instead of stdout")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="also scan subfolders of workouts/")
+    args = parser.parse_args(argv)
+    if args.format == "csv" and args.report == "all":
+        parser.error("--format csv needs a single --report (weekly, muscles, prs or frequency)")
+
+    workouts_dir = args.vault / WORKOUTS_FOLDER
+    if not workouts_dir.exists():
+        print(f"❌ Workouts folder not found: {workouts_dir}")
+        sys.exit(1)
+
+    analytics = VaultAnalytics(load_exercise_names(args.vault))
+    weeks = iter_weeks(analytics, workouts_dir, args.recursive)
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "csv":
+            count = write_csv(out, report_rows(args.report, analytics, weeks))
+        elif args.report == "all":
+            weekly, muscles = [], []
+            for week in weeks:
+                weekly.append(week.row())
+                muscles.extend(week.muscle_rows())
+            result = {
+                "summary": analytics.summary(),
+                "weekly": weekly,
+                "muscles": muscles,
+                "prs": list(report_rows("prs", analytics, iter(()))),
+                "frequency": list(report_rows("frequency", analytics, iter(()))),
+            }
+            count = len(weekly)
+            json.dump(result, out, indent=2, ensure_ascii=False)
+            out.write("\n")
+        else:
+            rows = list(report_rows(args.report, analytics, weeks))
+            count = len(rows)
+            json.dump(rows, out, indent=2, ensure_ascii=False)
+            out.write("\n")
+    finally:
+        if args.output:
+            out.close()
+
+    if args.output:
+        what = f"{count} weeks of analytics" if args.report == "all" else f"{count} {args.report} rows"
+        print(f"✅ Wrote {what} to {args.output} "
+              f"({analytics.sessions} sessions read)")
+
+
+if __name__ == "__main__":
+    main()
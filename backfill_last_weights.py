@@ -3,26 +3,96 @@
 backfill_last_weights.py
 
 Scans all workout markdown files in the vault's workouts/ folder,
-parses exercise sets, and writes _app_data/last-weights.json with
-the most recently used weight+reps per exercise.
+parses exercise sets, and writes .obsidian/last-weights.json (the sidecar
+VaultService reads) with the most recently used weight+reps per exercise.
 
 Usage:
-    python3 backfill_last_weights.py [vault_path]
+    python3 backfill_last_weights.py [vault_path] [--incremental | --newest-first] [--jobs N]
+    python3 backfill_last_weights.py [vault_path] --io-concurrency 32
+    python3 backfill_last_weights.py [vault_path] --merge [--since YYYY-MM-DD]
+    python3 backfill_last_weights.py [vault_path] --quiet --stats report.json
+    python3 backfill_last_weights.py [vault_path] --watch [--interval S] [--debounce S]
 
 Default vault path: ~/Documents/Onyx
+
+--output PATH writes somewhere else (relative paths are inside the vault).
+
+--merge loads the existing output and only replaces an entry when the
+parsed one has a newer updatedAt, keeping entries the app wrote that the
+markdown doesn't reflect. With --since, only files dated on or after that
+day are read, so a post-save refresh costs O(recent files).
+
+--incremental keeps a manifest (last-weights.manifest.json, next to the
+output) of each file's mtime, size, content hash and parsed result, and
+only re-reads files that were added or changed since the previous run.
+
+--jobs N parses files across N worker processes; results are still merged
+oldest → newest, so the output is identical to a serial run.
+
+--io-concurrency N is for vaults on iCloud/Dropbox/FUSE mounts, where each
+read waits on the network: an asyncio reader keeps up to N reads in flight
+on a thread pool while the main thread parses and merges files as they
+arrive, still oldest → newest.
+
+--newest-first walks files newest → oldest and stops as soon as every
+exercise listed in templates/w-*-t.md has been seen. Exercises that only
+appear in older files than that point are left out of the store.
+
+--progression also maintains progression.json next to the output: every
+exercise's per-file (date, max weight, max/total reps, set count) history,
+so a progression chart is one small file read. See the schema below.
+
+--stats [PATH] writes a JSON report (per-stage wall time, bytes read, lines
+scanned, SET_RE attempts vs. matches, slowest files) to PATH, or to stderr.
+--quiet drops the per-file and preview lines, which cost real time on
+large vaults.
+
+--watch stays running: it keeps every file's parsed result in memory, polls
+workouts/ for changes, waits for a burst of sync events to settle, then
+re-parses only the touched files and atomically rewrites the output.
 """
 
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import io
 import json
+import os
 import re
+import stat
 import sys
-from datetime import datetime
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, Iterator, NamedTuple
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
 DEFAULT_VAULT = Path.home() / "Documents" / "Onyx"
 WORKOUTS_FOLDER = "workouts"
-OUTPUT_PATH = "_app_data/last-weights.json"
+TEMPLATES_FOLDER = "templates"
+OUTPUT_PATH = ".obsidian/last-weights.json"   # matches VaultService.lastWeightsPath
+ALIASES_PATH = ".obsidian/exercise-aliases.json"   # { "alias": "Canonical name" }
+MANIFEST_VERSION = 3   # 3: progression summaries carry maxWeight (app rule) + maxWeightLb
+EXIT_UNCHANGED = 3   # --exit-code: output already up to date (argparse uses 2 for usage errors)
+DEFAULT_IO_CONCURRENCY = 32   # --io-concurrency with no value
+
+# Dated workout filenames: 2026-02-18-glutes-hamstrings.md
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# Sync-tool copies of a workout file. The app slugifies filenames, so a
+# space or parenthesis always comes from a sync client:
+#   "2026-02-13-chest 2.md", "2026-02-13-chest (1).md",
+#   "2026-02-13-chest (conflict).md", "2026-02-13-chest (Ana's conflicted copy).md",
+#   "2026-02-13-chest.sync-conflict-20260213-101500-ABC1234.md"
+CONFLICT_RE = re.compile(
+    r"(.+?)(?: \d+| \((?:\d+|[^)]*conflict[^)]*)\)|\.sync-conflict-[\w-]+)\.md$",
+    re.IGNORECASE
+)
 
 # Matches:  - [x] 135lbs × 10  or  - [ ] bodyweight x 8  or  - [x] 12.5 × 10
 SET_RE = re.compile(
@@ -30,90 +100,1383 @@ SET_RE = re.compile(
     re.IGNORECASE
 )
 
+# Weight strings (SET_RE group 1, lowercased): "135lbs", "60 kg", "12,5",
+# "bodyweight", "bw + 20kg". Unitless numbers are DEFAULT_WEIGHT_UNIT; numeric
+# values are compared in CANONICAL_UNIT.
+CANONICAL_UNIT = "lb"
+DEFAULT_WEIGHT_UNIT = "lb"
+KG_PER_LB = 0.45359237
+WEIGHT_UNITS = {
+    "": DEFAULT_WEIGHT_UNIT,
+    "lb": "lb", "lbs": "lb", "#": "lb", "pound": "lb", "pounds": "lb",
+    "kg": "kg", "kgs": "kg", "kilo": "kg", "kilos": "kg", "kilogram": "kg", "kilograms": "kg",
+}
+WEIGHT_RE = re.compile(r"(\d+(?:[.,]\d+)?|[.,]\d+)\s*([a-z#]*)\.?")
+BODYWEIGHT_RE = re.compile(r"(?:bodyweight|body weight|bw)(?:\s*\+\s*(.+))?")
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+def manifest_path_for(output_file: Path) -> Path:
+    """last-weights.json → last-weights.manifest.json in the same folder."""
+    return output_file.with_suffix(".manifest.json")
+
+
 def parse_date_from_filename(filename: str) -> str:
     """Extract YYYY-MM-DD from filename like 2026-02-18-glutes-hamstrings.md"""
-    match = re.match(r"(\d{4}-\d{2}-\d{2})", filename)
+    match = DATE_RE.match(filename)
     return match.group(1) if match else "1970-01-01"
 
 
+def is_real_date(date_str: str) -> bool:
+    """True for a YYYY-MM-DD string naming a calendar day (not 2026-02-30)."""
+    try:
+        date.fromisoformat(date_str)
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def note_impossible_date(path: Path) -> None:
+    """Tell stderr (once per file and process) that `path` is being skipped."""
+    print(f"⚠️  Skipping {path.name}: {path.name[:10]} is not a real date", file=sys.stderr)
+
+
+def scan_workout_files(
+    workouts_dir: Path, recursive: bool = False, keep_impossible_dates: bool = False
+) -> list[tuple[str, Path, os.stat_result]]:
+    """
+    One os.scandir pass over workouts/ returning (date, path, stat) for every
+    dated .md file, sorted oldest → newest. Each filename's date is parsed
+    once, and the stat is kept so callers can skip unchanged files without
+    another syscall. With `recursive`, subfolders such as workouts/2026/02/
+    are scanned too (hidden folders are skipped).
+
+    Files named after a day that doesn't exist (2026-02-30) can't be dated,
+    so they are left out with a note on stderr, unless
+    `keep_impossible_dates` (check_vault.py reports them itself).
+    """
+    found = []
+    pending = [workouts_dir]
+    while pending:
+        folder = pending.pop()
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".md"):
+                    m = DATE_RE.match(name)
+                    if m and entry.is_file():
+                        path = Path(entry.path)
+                        if not (keep_impossible_dates or is_real_date(m.group(1))):
+                            note_impossible_date(path)
+                            continue
+                        found.append((m.group(1), path, entry.stat()))
+                elif recursive and not name.startswith(".") and entry.is_dir():
+                    pending.append(Path(entry.path))
+    # Name as secondary key: same-day files merge in the same order everywhere
+    found.sort(key=lambda item: (item[0], item[1].name))
+    return found
+
+
+def find_workout_files(workouts_dir: Path, recursive: bool = False) -> list[Path]:
+    """
+    All dated workout .md files, sorted oldest → newest (so latest overwrites),
+    with sync duplicates and conflict copies removed (see dedupe_workout_files).
+    """
+    scanned, _ = dedupe_workout_files(scan_workout_files(workouts_dir, recursive))
+    return [path for _, path, _ in scanned]
+
+
+def conflict_base(filename: str) -> str:
+    """'2026-02-13-chest 2.md' → '2026-02-13-chest.md'; other names unchanged."""
+    m = CONFLICT_RE.match(filename)
+    return f"{m.group(1)}.md" if m else filename
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def dedupe_workout_files(
+    scanned: list[tuple[str, Path, os.stat_result]]
+) -> tuple[list[tuple[str, Path, os.stat_result]], list[dict]]:
+    """
+    Drop sync duplicates from a scan_workout_files() list.
+
+    Sync copies ("… 2.md", "… (conflict).md", see CONFLICT_RE) are grouped
+    with their original. One file per group is kept: the original name if
+    present, else the most recently modified copy (then the later name).
+    Other same-day files are only hashed when their sizes match, so a
+    byte-identical duplicate under any name is read once and parsed never.
+
+    Returns (kept, issues); each issue is { kind, kept, dropped } where kind
+    is "duplicate" (same bytes, dropped silently) or "conflict" (different
+    content, dropped and worth a look).
+    """
+    groups: dict[tuple[str, str], list] = {}
+    for item in scanned:
+        groups.setdefault((item[0], conflict_base(item[1].name)), []).append(item)
+
+    kept = []
+    issues = []
+    digests: dict[Path, str] = {}
+
+    def same_bytes(a, b) -> bool:
+        if a[2].st_size != b[2].st_size:
+            return False
+        for _, path, _ in (a, b):
+            if path not in digests:
+                digests[path] = file_digest(path)
+        return digests[a[1]] == digests[b[1]]
+
+    for (_, base), items in groups.items():
+        if len(items) > 1:
+            items.sort(key=lambda it: (it[1].name == base, it[2].st_mtime_ns, it[1].name))
+            winner = items[-1]
+            for loser in items[:-1]:
+                kind = "duplicate" if same_bytes(winner, loser) else "conflict"
+                issues.append({"kind": kind, "kept": winner[1].name, "dropped": loser[1].name})
+        kept.append(items[-1])
+
+    # Identical content under unrelated names on the same day (e.g. an import
+    # that copied a session): keep the first name
+    by_size: dict[tuple[str, int], list] = {}
+    for item in kept:
+        by_size.setdefault((item[0], item[2].st_size), []).append(item)
+    dropped = set()
+    for items in by_size.values():
+        items.sort(key=lambda it: it[1].name)
+        for i, item in enumerate(items):
+            for earlier in items[:i]:
+                if earlier[1] not in dropped and same_bytes(earlier, item):
+                    issues.append({"kind": "duplicate", "kept": earlier[1].name,
+                                   "dropped": item[1].name})
+                    dropped.add(item[1])
+                    break
+
+    kept = [item for item in kept if item[1] not in dropped]
+    kept.sort(key=lambda item: (item[0], item[1].name))
+    return kept, issues
+
+
+def iter_workout_sets(path: Path) -> Iterator[tuple[str, str, int, bool]]:
+    """
+    Stream every set line in a workout file as (exercise, weight, reps, done).
+
+    The file is read line by line, so memory stays flat regardless of file
+    size. The YAML frontmatter block is skipped.
+    """
+    with open(path, encoding="utf-8") as f:
+        skip_frontmatter(f)
+        yield from iter_set_lines(f)
+
+
+def iter_set_lines(lines: Iterable[str]) -> Iterator[tuple[str, str, int, bool]]:
+    """
+    Yield (exercise, weight, reps, done) for each set line in a workout body.
+    SET_RE only runs on lines under an exercise header that could be a
+    `- [ ]` set line.
+    """
+    for _, exercise, line, _, m in iter_body_lines(lines):
+        if m:
+            done = line[line.index("[") + 1] in "xX"
+            yield exercise, m.group(1).strip(), int(m.group(2)), done
+
+
+def iter_body_lines(
+    lines: Iterable[str], lineno: int = 1
+) -> Iterator[tuple[int, str | None, str, bool, re.Match | None]]:
+    """
+    Walk a workout body with the parsers' rules, numbering lines from
+    `lineno`. Yields (lineno, exercise, line, is_header, match) for every
+    `### ` header (exercise is its own text) and every line that could be a
+    set line (exercise is the header in effect, None before the first).
+    SET_RE only runs once a non-empty header is in effect; otherwise match
+    is None.
+    """
+    exercise = None
+
+    for lineno, line in enumerate(lines, lineno):
+        # Detect exercise header: ### Exercise Name
+        if line.startswith("### "):
+            exercise = line[4:].strip()
+            yield lineno, exercise, line, True, None
+
+        # Detect set line — every set line contains "[", so a substring
+        # check filters prose before the (much slower) regex runs
+        elif "[" in line:
+            yield lineno, exercise, line, False, SET_RE.match(line) if exercise else None
+
+
 def parse_workout_file(path: Path) -> dict[str, dict]:
     """
     Parse a single workout file.
     Returns { exercise_name: { weight, reps, updatedAt } }
     using the LAST set per exercise (progressive overload = last set is peak).
+
+    Same line handling as iter_workout_sets(), inlined because this is the
+    backfill's hot loop and a generator per set costs ~50% more time.
     """
-    text = path.read_text(encoding="utf-8")
-    date_str = parse_date_from_filename(path.name)
+    with open(path, encoding="utf-8") as f:
+        return parse_workout_stream(f, parse_date_from_filename(path.name))
+
+
+def parse_workout_bytes(path: Path, data: bytes) -> dict[str, dict]:
+    """parse_workout_file() over bytes already read (see aread_workout_files)."""
+    return parse_workout_stream(text_stream(data), parse_date_from_filename(path.name))
+
+
+def text_stream(data: bytes) -> io.StringIO:
+    """A file's bytes as the text stream open(path, encoding="utf-8") would give."""
+    return io.StringIO(data.decode("utf-8"), newline=None)   # same newlines as open()
+
+
+def parse_workout_stream(f, date_str: str) -> dict[str, dict]:
+    """parse_workout_file() over any open text stream."""
+    skip_frontmatter(f)
+    return parse_workout_lines(f, date_str)
+
 
+def parse_workout_lines(lines: Iterable[str], date_str: str, match=SET_RE.match) -> dict[str, dict]:
+    """
+    The parse loop over a workout body. `match` is SET_RE.match; the --stats
+    parser passes a counting wrapper, so its numbers come from this loop.
+    """
     results = {}
     current_exercise = None
 
-    for line in text.splitlines():
-        # Detect exercise header: ### Exercise Name
+    for line in lines:
         if line.startswith("### "):
             current_exercise = line[4:].strip()
             continue
 
-        # Detect set line
-        if current_exercise:
-            m = SET_RE.match(line)
+        if current_exercise and "[" in line:
+            m = match(line)
             if m:
-                weight = m.group(1).strip()
-                reps = int(m.group(2))
                 # Always overwrite — last set in file wins (progressive overload)
                 results[current_exercise] = {
-                    "weight": weight,
-                    "reps": reps,
+                    "weight": m.group(1).strip(),
+                    "reps": int(m.group(2)),
                     "updatedAt": date_str
                 }
 
     return results
 
 
+class ParseCounters:
+    """Body lines seen and SET_RE attempts/matches, fed by parse_workout_lines()."""
+
+    def __init__(self):
+        self.lines = self.attempts = self.matches = 0
+
+    def count_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        for line in lines:
+            self.lines += 1
+            yield line
+
+    def match(self, line: str):
+        self.attempts += 1
+        m = SET_RE.match(line)
+        if m:
+            self.matches += 1
+        return m
+
+
+def profile_workout_stream(f, path: Path, nbytes: int | None = None) -> tuple[dict[str, dict], dict]:
+    """
+    parse_workout_stream() with counters, for --stats. Returns the same result
+    plus { file, seconds, bytes, lines, regex_attempts, regex_matches }.
+    `nbytes` defaults to the file's size on disk.
+    """
+    t0 = time.perf_counter()
+    counters = ParseCounters()
+    skip_frontmatter(f)
+    results = parse_workout_lines(counters.count_lines(f), parse_date_from_filename(path.name),
+                                  counters.match)
+    return results, {
+        "file": path.name,
+        "seconds": time.perf_counter() - t0,
+        "bytes": path.stat().st_size if nbytes is None else nbytes,
+        "lines": counters.lines,
+        "regex_attempts": counters.attempts,
+        "regex_matches": counters.matches,
+    }
+
+
+def profile_workout_file(path: Path) -> tuple[dict[str, dict], dict]:
+    """parse_workout_file() with --stats counters (see profile_workout_stream)."""
+    with open(path, encoding="utf-8") as f:
+        return profile_workout_stream(f, path)
+
+
+def profile_workout_bytes(path: Path, data: bytes) -> tuple[dict[str, dict], dict]:
+    """parse_workout_bytes() with --stats counters; `seconds` excludes the read."""
+    return profile_workout_stream(text_stream(data), path, nbytes=len(data))
+
+
+class BackfillStats:
+    """Collects --stats timings and per-file parser counters."""
+
+    SLOWEST = 10
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self.files: list[dict] = []
+        self.extra: dict = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+
+    def report(self) -> dict:
+        totals = {key: sum(fs[key] for fs in self.files)
+                  for key in ("bytes", "lines", "regex_attempts", "regex_matches")}
+        slowest = sorted(self.files, key=lambda fs: fs["seconds"], reverse=True)
+        return {
+            "stages": {name: round(sec, 6) for name, sec in self.stages.items()},
+            "total_seconds": round(sum(self.stages.values()), 6),
+            "files_parsed": len(self.files),
+            "bytes_read": totals["bytes"],
+            "lines_scanned": totals["lines"],
+            "regex_attempts": totals["regex_attempts"],
+            "regex_matches": totals["regex_matches"],
+            "slowest_files": [
+                {**fs, "seconds": round(fs["seconds"], 6)} for fs in slowest[:self.SLOWEST]
+            ],
+            **self.extra,
+        }
+
+
+class Weight(NamedTuple):
+    """A parsed weight string. `value` is in `unit`; for bodyweight sets it is
+    the added load ("bw + 20kg"), or None for plain bodyweight."""
+    value: float | None
+    unit: str | None            # "lb" or "kg"
+    is_bodyweight: bool
+
+    def in_unit(self, unit: str = CANONICAL_UNIT) -> float | None:
+        if self.value is None or self.unit == unit:
+            return self.value
+        factor = KG_PER_LB if unit == "kg" else 1 / KG_PER_LB
+        return round(self.value * factor, 2)
+
+
+@lru_cache(maxsize=4096)
+def parse_weight(raw: str) -> Weight:
+    """
+    "135lbs" → (135, lb), "60 kg" → (60, kg), "12,5" → (12.5, lb),
+    "bodyweight" / "bw" / "" → bodyweight, "bw+20kg" → bodyweight + 20 kg.
+    Unitless numbers are DEFAULT_WEIGHT_UNIT. Anything else (e.g. "2x20")
+    is unparseable: (None, None, False).
+
+    Memoized: a vault repeats a few hundred distinct strings across every
+    file, so hot loops pay a dict lookup instead of a regex per set.
+    """
+    text = raw.strip().lower()
+    if not text:
+        return Weight(None, None, True)
+    bodyweight = BODYWEIGHT_RE.fullmatch(text)
+    if bodyweight:
+        text = bodyweight.group(1)
+        if not text:
+            return Weight(None, None, True)
+    m = WEIGHT_RE.fullmatch(text)
+    unit = WEIGHT_UNITS.get(m.group(2)) if m else None
+    if unit is None:
+        return Weight(None, None, False)
+    return Weight(float(m.group(1).replace(",", ".")), unit, bodyweight is not None)
+
+
+def numeric_weight(weight: str, unit: str = CANONICAL_UNIT) -> float | None:
+    """
+    Weight string → number in `unit` (pounds by default), so kg and lb sets
+    compare correctly. Bodyweight sets (with or without added load) and
+    unparseable strings are None.
+    """
+    parsed = parse_weight(weight)
+    return None if parsed.is_bodyweight else parsed.in_unit(unit)
+
+
+def skip_frontmatter(f) -> list[str] | None:
+    """
+    Advance an open text file past a leading `---` … `---` YAML block and
+    return the lines inside it. Leaves the file at the start if there is no
+    frontmatter, or rewinds it there if the block is never closed (so the
+    whole file is still parsed); both return None.
+    """
+    if f.readline().rstrip("\r\n") != "---":
+        f.seek(0)
+        return None
+    block = []
+    for line in f:
+        if line.rstrip("\r\n") == "---":
+            return block
+        block.append(line)
+    f.seek(0)
+    return None
+
+
+def read_frontmatter(f) -> dict[str, str | list[str]]:
+    """
+    Consume and parse a leading YAML frontmatter block from an open text file.
+
+    Handles the flat shape MarkdownWriter produces: `key: value` scalars and
+    `key:` followed by `  - item` lists. List items have quotes and
+    [[wikilink]] brackets removed, so `  - "[[chest]]"` becomes "chest".
+    Returns {} (file rewound) when there is no complete frontmatter block.
+    """
+    if f.readline().rstrip("\r\n") != "---":
+        f.seek(0)
+        return {}
+
+    meta = {}
+    key = None
+    for line in f:
+        line = line.rstrip("\r\n")
+        if line == "---":
+            return meta
+        stripped = line.strip()
+        if stripped.startswith("- ") and key is not None:
+            if not isinstance(meta.get(key), list):
+                meta[key] = []
+            meta[key].append(stripped[2:].strip().strip("\"'").removeprefix("[[").removesuffix("]]"))
+        elif ":" in line and not line[:1].isspace():
+            key, _, value = line.partition(":")
+            key = key.strip()
+            meta[key] = value.strip()
+    f.seek(0)
+    return {}
+
+
+def parse_workout_files(
+    paths: list[Path], jobs: int = 1, stats: BackfillStats | None = None,
+    pool: ProcessPoolExecutor | None = None,
+) -> list[dict[str, dict]]:
+    """
+    Parse many workout files, returning results in the same order as `paths`.
+    With jobs > 1 the files are handed to a process pool in chunks so each
+    worker reads and regex-matches a batch per round trip. Pass `pool` to
+    reuse one pool across calls instead of starting one per call. With
+    `stats`, the instrumented parser runs instead and its counters are
+    recorded.
+    """
+    parse = parse_workout_file if stats is None else profile_workout_file
+    if jobs <= 1 or len(paths) < 2:
+        results = [parse(p) for p in paths]
+    else:
+        chunksize = max(1, len(paths) // (jobs * 4))
+        if pool is not None:
+            results = list(pool.map(parse, paths, chunksize=chunksize))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(parse, paths, chunksize=chunksize))
+
+    if stats is None:
+        return results
+    stats.files.extend(fs for _, fs in results)
+    return [parsed for parsed, _ in results]
+
+
+def load_template_exercises(templates_dir: Path) -> set[str]:
+    """
+    Collect exercise names from every templates/w-*-t.md file.
+    Mirrors MarkdownParser.parseTemplate: top-level `- Name` lines are
+    exercises; indented lines (video links) are ignored.
+    """
+    names = set()
+    for tf in templates_dir.glob("w-*-t.md"):
+        with open(tf, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("- "):
+                    names.add(line[2:].strip())
+    return names
+
+
+def backfill_newest_first(
+    workout_files: list[Path], targets: set[str], jobs: int = 1,
+    stats: BackfillStats | None = None, names: "ExerciseNames | None" = None,
+) -> tuple[dict[str, dict], int]:
+    """
+    Merge files newest → oldest, keeping only the first (latest) entry seen
+    per exercise. Stops once every name in `targets` is resolved; with no
+    targets it reads everything. With jobs > 1 files are parsed in chunks of
+    jobs * 8, so up to one chunk past the stopping point may be read.
+    Returns (store, number_of_files_read). With `names`, exercises are keyed
+    (and targets matched) by ExerciseNames.store_key().
+    """
+    canonical = names.store_key if names else str
+    store = {}
+    remaining = {canonical(name) for name in targets}
+    newest_first = workout_files[::-1]
+    # Serially, read one file at a time so the early exit is exact
+    chunk = 1 if jobs <= 1 else jobs * 8
+    read = 0
+
+    # One pool for the whole walk: starting one per chunk costs more than
+    # parsing the chunk when the walk has to cover the whole vault
+    with (ProcessPoolExecutor(max_workers=jobs) if jobs > 1
+          else contextlib.nullcontext()) as pool:
+        for start in range(0, len(newest_first), chunk):
+            batch = newest_first[start:start + chunk]
+            read += len(batch)
+            for parsed in parse_workout_files(batch, jobs, stats, pool):
+                for name, entry in parsed.items():
+                    name = canonical(name)
+                    if name not in store:
+                        store[name] = entry
+                        remaining.discard(name)
+            if targets and not remaining:
+                break
+
+    return store, read
+
+
+# ── Concurrent reads ──────────────────────────────────────────────────────────
+#
+# On synced mounts (iCloud, Dropbox, FUSE) opening and reading a file costs
+# tens of milliseconds of waiting, not CPU, so processes don't help: what
+# helps is having many reads outstanding. Reads run on a thread pool (they
+# release the GIL while blocked); parsing and merging stay on the event
+# loop's thread, consuming files strictly in input (date) order.
+
+async def aread_workout_files(
+    paths: list[Path], concurrency: int = DEFAULT_IO_CONCURRENCY,
+    read: Callable[[Path], bytes] = Path.read_bytes,
+) -> AsyncIterator[tuple[Path, bytes]]:
+    """
+    Yield (path, contents) in the order of `paths`, with up to `concurrency`
+    reads in flight. Reads that finish ahead of a slow one are buffered, but
+    never more than 4 × concurrency files at a time, so memory stays bounded
+    however far ahead the pool gets.
+    """
+    loop = asyncio.get_running_loop()
+    io_slots = asyncio.Semaphore(concurrency)
+    window = asyncio.Semaphore(concurrency * 4)
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def read_one(path: Path) -> bytes:
+        try:
+            return await loop.run_in_executor(pool, read, path)
+        finally:
+            io_slots.release()
+
+    async def schedule() -> None:
+        for path in paths:
+            await window.acquire()
+            await io_slots.acquire()
+            queue.put_nowait((path, asyncio.ensure_future(read_one(path))))
+        queue.put_nowait(None)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        producer = asyncio.ensure_future(schedule())
+        try:
+            while (item := await queue.get()) is not None:
+                path, task = item
+                data = await task
+                window.release()
+                yield path, data
+        finally:
+            producer.cancel()
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is not None:
+                    item[1].cancel()
+
+
+def merge_concurrent_reads(
+    workout_files: list[Path], concurrency: int = DEFAULT_IO_CONCURRENCY,
+    names: "ExerciseNames | None" = None,
+    on_file: Callable[[Path, dict[str, dict]], None] | None = None,
+    read: Callable[[Path], bytes] = Path.read_bytes,
+    stats: BackfillStats | None = None,
+) -> dict[str, dict]:
+    """
+    The serial parse + merge, fed by aread_workout_files(): each file is
+    parsed and merged as soon as it and every older file have been read.
+    `on_file(path, parsed)` is called in merge order. `read` is swappable so
+    benchmarks can inject latency. With `stats`, per-file parser counters
+    are recorded as in parse_workout_files(). Returns the store.
+    """
+    async def run() -> dict[str, dict]:
+        store = {}
+        async for path, data in aread_workout_files(workout_files, concurrency, read):
+            if stats is None:
+                parsed = parse_workout_bytes(path, data)
+            else:
+                parsed, file_stats = profile_workout_bytes(path, data)
+                stats.files.append(file_stats)
+            if parsed:
+                store.update(names.store_keys(parsed) if names else parsed)
+            if on_file is not None:
+                on_file(path, parsed)
+        return store
+
+    return asyncio.run(run())
+
+
+# ── Exercise names ────────────────────────────────────────────────────────────
+
+def fold_name(name: str) -> str:
+    """Case- and whitespace-insensitive key: " Chest  Press" → "chest press"."""
+    return " ".join(name.split()).casefold()
+
+
+def load_aliases(path: Path) -> dict[str, str]:
+    """Read the alias file ({ alias: canonical }); missing or invalid → {}."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable alias file {path}: {e}")
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(k): str(v) for k, v in data.items() if isinstance(v, str)}
+
+
+class ExerciseNames:
+    """
+    Maps raw `### ` header text to one canonical exercise name.
+
+    Names that differ only in case or whitespace fold to the same key. A
+    key's canonical spelling is the alias file's target, else the first
+    `preferred` name (template spellings, so the app's lookups by template
+    name still hit), else the folded name with its first letter capitalized
+    ("cable  FLY" → "Cable fly"). It never depends on which spelling a run
+    happens to read first. Built once per run; every lookup is a dict hit,
+    and raw strings are memoized.
+
+    The files the app reads (last-weights.json, progression.json) are keyed
+    with store_key() instead: only alias and preferred names are rewritten
+    there, other headers keep their exact text, which is what the app looks
+    up. A header spelled exactly like one of the `preferred` names is kept
+    as is, so two templates that spell one exercise differently both find
+    their entry.
+    """
+
+    def __init__(self, aliases: dict[str, str] | None = None, preferred: Iterable[str] = ()):
+        self._table: dict[str, str] = {}    # folded name → alias/preferred spelling
+        self._raw: dict[str, str] = {}      # raw header text → canonical spelling
+        self._preferred: set[str] = set()   # exact preferred spellings
+        self._store: dict[str, str] = {}    # folded alias → preferred target as written
+        for name in preferred:
+            name = " ".join(name.split())
+            self._preferred.add(name)
+            self._table.setdefault(fold_name(name), name)
+
+        aliases = {fold_name(k): v for k, v in (aliases or {}).items()}
+        for key, target in aliases.items():
+            # Follow chains (a → b → c), stopping at a cycle
+            seen = {key}
+            while fold_name(target) in aliases and fold_name(target) not in seen:
+                seen.add(fold_name(target))
+                target = aliases[fold_name(target)]
+            target = " ".join(target.split())
+            if target in self._preferred:
+                self._store[key] = target
+            canonical = self._table.get(fold_name(target)) or target
+            self._table[key] = canonical
+            self._table.setdefault(fold_name(target), canonical)
+
+    def canonical(self, name: str) -> str:
+        hit = self._raw.get(name)
+        if hit is None:
+            key = fold_name(name)
+            hit = self._table.get(key) or key[:1].upper() + key[1:]
+            self._raw[name] = hit
+        return hit
+
+    def store_key(self, name: str) -> str:
+        """
+        `name` unchanged if it is a preferred spelling, else its alias
+        target (as written, when that is a preferred spelling) or preferred
+        spelling, else `name` unchanged.
+        """
+        if name in self._preferred:
+            return name
+        key = fold_name(name)
+        return self._store.get(key) or self._table.get(key, name)
+
+    def folded_spellings(self, name: str) -> set[str]:
+        """Every fold_name() key that canonicalizes to the same name as `name`."""
+        canonical = self.canonical(name)
+        keys = {fold_name(name), fold_name(canonical)}
+        keys.update(key for key, target in self._table.items() if target == canonical)
+        return keys
+
+    def canonicalize(self, entries: dict[str, dict]) -> dict[str, dict]:
+        """Re-key a per-exercise dict; on collisions the later key wins."""
+        return {self.canonical(name): entry for name, entry in entries.items()}
+
+    def store_keys(self, entries: dict[str, dict]) -> dict[str, dict]:
+        """canonicalize() with store_key(); on collisions the later key wins."""
+        return {self.store_key(name): entry for name, entry in entries.items()}
+
+
+def load_exercise_names(vault: Path, preferred: Iterable[str] | None = None) -> ExerciseNames:
+    """
+    ExerciseNames from the vault's alias file, preferring `preferred` spellings
+    (default: every exercise listed in the templates, in sorted order).
+    """
+    if preferred is None:
+        templates_dir = vault / TEMPLATES_FOLDER
+        preferred = sorted(load_template_exercises(templates_dir)) if templates_dir.is_dir() else []
+    return ExerciseNames(load_aliases(vault / ALIASES_PATH), preferred)
+
+
+# ── Incremental manifest ──────────────────────────────────────────────────────
+
+def load_manifest(path: Path) -> dict[str, dict]:
+    """
+    Load the per-file manifest written by a previous --incremental run.
+    Returns { filename: { mtime, size, sha256, result } }, or {} if the
+    manifest is missing, unreadable or from another manifest version.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_manifest(path: Path, files: dict[str, dict]) -> None:
+    """Write the manifest compactly — it is a cache, not meant for reading."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": files}, f,
+                  ensure_ascii=False, separators=(",", ":"))
+
+
+def refresh_manifest_entry(
+    path: Path, cached: dict | None, st: os.stat_result | None = None
+) -> tuple[dict, bool]:
+    """
+    Return (entry, needs_parse) for one workout file.
+
+    An unchanged mtime + size reuses the cached entry without opening the
+    file. Otherwise the file is read and hashed; identical content (e.g. a
+    touch or a sync re-download) still reuses the cached parse result.
+    When needs_parse is True the caller must fill in entry["result"].
+    Pass `st` from a directory scan to avoid a second stat call.
+    """
+    st = st or path.stat()
+    if cached and cached.get("mtime") == st.st_mtime_ns and cached.get("size") == st.st_size:
+        return cached, False
+
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    if cached and cached.get("sha256") == digest:
+        return {**cached, "mtime": st.st_mtime_ns, "size": st.st_size}, False
+
+    return {"mtime": st.st_mtime_ns, "size": st.st_size, "sha256": digest}, True
+
+
+def parse_incremental(
+    workout_files: list[Path], manifest_file: Path, jobs: int = 1,
+    stats: BackfillStats | None = None,
+    file_stats: dict[Path, os.stat_result] | None = None,
+) -> list[dict[str, dict]]:
+    """
+    Like parse_workout_files(), but reuses per-file results cached in the
+    manifest and only parses files that were added or changed. The manifest
+    is rewritten when anything (including a dropped file) changed.
+    `file_stats` are stats already taken by scan_workout_files().
+
+    Entries are keyed by filename, which stays unique with year/month
+    subfolders because every workout filename starts with its full date.
+    """
+    previous = load_manifest(manifest_file)
+    file_stats = file_stats or {}
+    manifest = {}
+    stale = []
+    dirty = False
+    for wf in workout_files:
+        cached = previous.get(wf.name)
+        entry, needs_parse = refresh_manifest_entry(wf, cached, file_stats.get(wf))
+        manifest[wf.name] = entry
+        if needs_parse:
+            stale.append(wf)
+        dirty = dirty or entry is not cached
+    for wf, parsed in zip(stale, parse_workout_files(stale, jobs, stats)):
+        manifest[wf.name]["result"] = parsed
+
+    removed = len(previous.keys() - manifest.keys())
+    print(f"♻️  Incremental: {len(stale)} re-parsed, "
+          f"{len(workout_files) - len(stale)} cached, {removed} removed")
+    if stats is not None:
+        stats.extra["incremental"] = {"reparsed": len(stale), "removed": removed,
+                                      "cached": len(workout_files) - len(stale)}
+    if dirty or removed:
+        save_manifest(manifest_file, manifest)
+    return [manifest[wf.name]["result"] for wf in workout_files]
+
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def merge_results(
+    workout_files: list[Path], results: dict[str, dict], names: ExerciseNames | None = None
+) -> dict[str, dict]:
+    """Merge per-file results (keyed by filename) oldest → newest."""
+    store = {}
+    for wf in workout_files:
+        parsed = results.get(wf.name, {})
+        store.update(names.store_keys(parsed) if names else parsed)
+    return store
+
+
+def load_store(output_file: Path) -> dict[str, dict]:
+    """Read an existing last-weights store; missing or unreadable → {}."""
+    try:
+        with open(output_file, encoding="utf-8") as f:
+            store = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable store {output_file}: {e}")
+        return {}
+    return store if isinstance(store, dict) else {}
+
+
+def merge_newer(existing: dict[str, dict], parsed: dict[str, dict]) -> tuple[dict[str, dict], int]:
+    """
+    Overlay parsed entries onto an existing store, replacing an exercise
+    only when the parsed updatedAt is strictly newer. Returns (store, replaced).
+    """
+    store = dict(existing)
+    replaced = 0
+    for name, entry in parsed.items():
+        current = store.get(name)
+        if not isinstance(current, dict) or entry["updatedAt"] > str(current.get("updatedAt", "")):
+            store[name] = entry
+            replaced += 1
+    return store, replaced
+
+
+def with_weight_values(store: dict[str, dict]) -> dict[str, dict]:
+    """
+    Add `weightValue` (the weight in CANONICAL_UNIT, null for bodyweight or
+    unparseable strings) to every entry, so consumers compare numbers instead
+    of re-parsing "135lbs" / "60kg". The app ignores the extra key.
+    """
+    return {
+        name: {**entry, "weightValue": numeric_weight(entry["weight"])}
+        if isinstance(entry, dict) and isinstance(entry.get("weight"), str) else entry
+        for name, entry in store.items()
+    }
+
+
+def write_store(output_file: Path, store: dict[str, dict]) -> bool:
+    """
+    Write the store as sorted, pretty-printed JSON (with canonical weight
+    values), only if it changed. Returns True if the file was written
+    (see write_if_changed).
+    """
+    data = json.dumps(dict(sorted(with_weight_values(store).items())), indent=2, ensure_ascii=False)
+    return write_if_changed(output_file, data.encode("utf-8"))
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Atomically replace `path` with `data`, unless it already holds exactly
+    those bytes — an unchanged file keeps its mtime and doesn't trigger a
+    sync upload. Otherwise the bytes go to a temp file in the same folder,
+    are fsynced, and renamed over the target, so a crash can never leave a
+    truncated file behind. The file keeps its permissions (mkstemp's 0600
+    is replaced); new files get the usual 0666 minus umask. Returns True
+    if the file was written.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = file_mode(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    fsync_dir(path.parent)
+    return True
+
+
+def file_mode(path: Path) -> int:
+    """Permission bits of `path`, or what open() would give a new file."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def fsync_dir(path: Path) -> None:
+    """Persist a rename in `path` (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# ── Progression sidecar ───────────────────────────────────────────────────────
+#
+# progression.json (schema version 2), written next to the output:
+#
+#   {
+#     "version": 2,
+#     "through": "2026-02-20",               // newest file date covered (null if none)
+#     "exercises": {
+#       "<exercise>": [                      // oldest → newest, one per file
+#         { "date": "2026-02-13", "file": "2026-02-13-chest.md",
+#           "maxWeight": 60.0,               // app's rule; null = bodyweight-only
+#           "maxWeightLb": 132.28,           // pounds; null = no numeric weight
+#           "maxReps": 10, "totalReps": 28, "sets": 3 }
+#       ]
+#     }
+#   }
+#
+# One point per file, matching ExerciseProgressionView's ExerciseDataPoint.
+# The app trusts cached points dated before "through" and parses files
+# dated on/after it itself, so sessions saved since the last backfill still
+# show up. Both halves of its chart must agree, so maxWeight follows
+# MarkdownParser.parseSets (app_weight_value: digits only, no unit
+# conversion). maxWeightLb is numeric_weight(), in CANONICAL_UNIT with kg
+# converted, for the Python tools. Version 1 files carried pounds in
+# maxWeight and are ignored by the app.
+#
+# Per-file bookkeeping for incremental updates (mtime, size, sha256 and the
+# file's summary) lives in progression.manifest.json, so the file the app
+# reads stays small.
+
+PROGRESSION_FILENAME = "progression.json"
+PROGRESSION_VERSION = 2
+
+
+def app_weight_value(weight: str) -> float | None:
+    """
+    A weight the way MarkdownParser.parseSets reads it: None for empty,
+    "bodyweight" or "bw", otherwise the string's digits and dots as a number
+    ("60kg" → 60, "bw + 20kg" → 20). No unit conversion.
+    """
+    text = weight.strip()
+    if text.lower() in ("", "bodyweight", "bw"):
+        return None
+    try:
+        return float("".join(c for c in text if c.isdigit() or c == "."))
+    except ValueError:
+        return None
+
+
+def summarize_workout_file(path: Path) -> dict[str, dict]:
+    """
+    { exercise: { maxWeight, maxWeightLb, maxReps, totalReps, sets } } over
+    every set in a file (see the schema above for the two weights).
+    """
+    summary = {}
+    for exercise, weight, reps, _ in iter_workout_sets(path):
+        point = summary.get(exercise)
+        if point is None:
+            point = summary[exercise] = {"maxWeight": None, "maxWeightLb": None,
+                                         "maxReps": 0, "totalReps": 0, "sets": 0}
+        for key, value in (("maxWeight", app_weight_value(weight)),
+                           ("maxWeightLb", numeric_weight(weight))):
+            if value is not None and (point[key] is None or value > point[key]):
+                point[key] = value
+        point["maxReps"] = max(point["maxReps"], reps)
+        point["totalReps"] += reps
+        point["sets"] += 1
+    return summary
+
+
+def merge_summary_points(into: dict, point: dict) -> None:
+    """Fold one summary point into another from the same file (aliased names)."""
+    for key in ("maxWeight", "maxWeightLb"):
+        if point[key] is not None and (into[key] is None or point[key] > into[key]):
+            into[key] = point[key]
+    into["maxReps"] = max(into["maxReps"], point["maxReps"])
+    into["totalReps"] += point["totalReps"]
+    into["sets"] += point["sets"]
+
+
+def load_progression(path: Path) -> dict:
+    """Read progression.json; a missing, unreadable or other-version file → empty cache."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get("version") != PROGRESSION_VERSION:
+        return {"version": PROGRESSION_VERSION, "through": None, "exercises": {}}
+    return data
+
+
+def update_progression(
+    path: Path, scanned: list[tuple[str, Path, os.stat_result]],
+    names: ExerciseNames | None = None,
+) -> tuple[bool, int]:
+    """
+    Bring progression.json up to date with `scanned` (from scan_workout_files).
+    Only files whose mtime/size and content hash changed are re-read; the
+    per-exercise series are then rebuilt from the cached per-file summaries,
+    which keep raw names, so alias changes apply without re-reading files.
+    Series are keyed with ExerciseNames.store_key(), like the store, because
+    the app looks them up by exact exercise name.
+    Returns (written, files_resummarized).
+    """
+    manifest_file = manifest_path_for(path)
+    previous = load_manifest(manifest_file)
+    files = {}
+    resummarized = 0
+    dirty = False
+    for date_str, wf, st in scanned:
+        cached = previous.get(wf.name)
+        entry, needs_parse = refresh_manifest_entry(wf, cached, st)
+        if needs_parse:
+            entry["summary"] = summarize_workout_file(wf)
+            entry["date"] = date_str
+            resummarized += 1
+        files[wf.name] = entry
+        dirty = dirty or entry is not cached
+    if dirty or previous.keys() - files.keys():
+        save_manifest(manifest_file, files)
+
+    exercises: dict[str, list[dict]] = {}
+    for name, entry in sorted(files.items(), key=lambda kv: (kv[1]["date"], kv[0])):
+        for exercise, point in entry["summary"].items():
+            series = exercises.setdefault(names.store_key(exercise) if names else exercise, [])
+            if series and series[-1]["file"] == name:
+                # Two spellings of one exercise in the same file: one point
+                merge_summary_points(series[-1], point)
+            else:
+                series.append({"date": entry["date"], "file": name, **point})
+
+    data = {"version": PROGRESSION_VERSION,
+            "through": max((e["date"] for e in files.values()), default=None),
+            "exercises": dict(sorted(exercises.items()))}
+    encoded = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return write_if_changed(path, encoded), resummarized
+
+
+# ── Watch mode ────────────────────────────────────────────────────────────────
+
+def snapshot(workouts_dir: Path, recursive: bool = False) -> dict[str, tuple[Path, int, int]]:
+    """
+    { filename: (path, mtime_ns, size) } for every dated workout file, oldest
+    first, without sync duplicates / conflict copies.
+    """
+    kept, _ = dedupe_workout_files(scan_workout_files(workouts_dir, recursive))
+    return {path.name: (path, st.st_mtime_ns, st.st_size) for _, path, st in kept}
+
+
+def parse_readable(paths: list[Path], jobs: int = 1) -> dict[Path, dict[str, dict]]:
+    """
+    parse_workout_files() for --watch, leaving out files that can't be read
+    or decoded right now (deleted mid-scan, half-synced) instead of raising.
+    """
+    try:
+        return dict(zip(paths, parse_workout_files(paths, jobs)))
+    except (OSError, UnicodeDecodeError):
+        pass
+    parsed = {}
+    for path in paths:
+        try:
+            parsed[path] = parse_workout_file(path)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️  {path.name}: {e} — keeping its previous result until it changes")
+    return parsed
+
+
+def watch(
+    workouts_dir: Path, output_file: Path,
+    interval: float = 1.0, debounce: float = 2.0, jobs: int = 1,
+    recursive: bool = False, names: ExerciseNames | None = None,
+) -> None:
+    """
+    Keep output_file up to date until interrupted.
+
+    workouts/ is polled every `interval` seconds with one scandir pass.
+    Once a change is seen, polling continues until the folder has been
+    quiet for `debounce` seconds, so a sync client writing several files
+    (or one file in pieces) triggers a single re-parse and write.
+    A file that fails to read keeps its previous result and is retried the
+    next time its mtime or size changes.
+    """
+    known = snapshot(workouts_dir, recursive)
+    workout_files = [path for path, _, _ in known.values()]
+    results = {path.name: parsed for path, parsed in parse_readable(workout_files, jobs).items()}
+    write_store(output_file, merge_results(workout_files, results, names))
+    print(f"👀 Watching {workouts_dir} ({len(known)} files) — Ctrl-C to stop")
+
+    try:
+        while True:
+            time.sleep(interval)
+            try:
+                current = snapshot(workouts_dir, recursive)
+            except OSError:
+                continue    # a file vanished mid-scan; look again next poll
+            if current == known:
+                continue
+
+            # Debounce: wait until the folder stops changing
+            quiet_since = time.monotonic()
+            while time.monotonic() - quiet_since < debounce:
+                time.sleep(interval)
+                try:
+                    latest = snapshot(workouts_dir, recursive)
+                except OSError:
+                    quiet_since = time.monotonic()
+                    continue
+                if latest != current:
+                    current, quiet_since = latest, time.monotonic()
+
+            touched = [name for name, entry in current.items() if known.get(name) != entry]
+            removed = known.keys() - current.keys()
+            for name in removed:
+                results.pop(name, None)
+            for path, parsed in parse_readable([current[name][0] for name in touched],
+                                               jobs).items():
+                results[path.name] = parsed
+            known = current
+
+            store = merge_results([path for path, _, _ in current.values()], results, names)
+            written = write_store(output_file, store)
+            print(f"  🔄 {time.strftime('%H:%M:%S')} re-parsed {len(touched)}, "
+                  f"removed {len(removed)} → {len(store)} exercises"
+                  f"{'' if written else ' (unchanged, not written)'}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
-def main():
-    vault = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_VAULT
+def iso_date(value: str) -> str:
+    """argparse type: validate YYYY-MM-DD and keep it as a string."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild last-weights.json from the vault's workout files."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--incremental", action="store_true",
+                      help="only re-parse files added or changed since the last run")
+    mode.add_argument("--newest-first", action="store_true",
+                      help="walk files newest → oldest and stop once every template "
+                           "exercise has been seen")
+    mode.add_argument("--watch", action="store_true",
+                      help="keep running and update the output whenever workouts/ changes")
+    mode.add_argument("--io-concurrency", type=int, nargs="?", const=DEFAULT_IO_CONCURRENCY,
+                      default=0, metavar="N",
+                      help=f"keep N file reads in flight, for vaults on synced or network "
+                           f"mounts (default N: {DEFAULT_IO_CONCURRENCY})")
+    parser.add_argument("--interval", type=float, default=1.0, metavar="S",
+                        help="--watch polling interval in seconds (default: 1)")
+    parser.add_argument("--debounce", type=float, default=2.0, metavar="S",
+                        help="--watch quiet period before re-parsing (default: 2)")
+    parser.add_argument("--output", "-o", type=Path, default=Path(OUTPUT_PATH), metavar="PATH",
+                        help=f"store to write; relative paths are inside the vault "
+                             f"(default: {OUTPUT_PATH})")
+    parser.add_argument("--merge", action="store_true",
+                        help="keep the existing store and only replace entries with a "
+                             "newer updatedAt")
+    parser.add_argument("--since", type=iso_date, metavar="YYYY-MM-DD",
+                        help="only read files dated on or after this day (requires --merge)")
+    parser.add_argument("--progression", action="store_true",
+                        help=f"also update {PROGRESSION_FILENAME} (per-exercise history) "
+                             "next to the output")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="also scan subfolders of workouts/ (e.g. workouts/2026/02/)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="parse files in N worker processes (0 = one per CPU)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="skip per-file and preview lines")
+    parser.add_argument("--stats", "--profile", nargs="?", const="-", metavar="PATH",
+                        help="write a JSON timing/counter report to PATH (default: stderr)")
+    parser.add_argument("--exit-code", action="store_true",
+                        help=f"exit with {EXIT_UNCHANGED} when the output was already up to date")
+    args = parser.parse_args(argv)
+    if args.io_concurrency < 0:
+        parser.error("--io-concurrency must be at least 1")
+    if args.io_concurrency and args.jobs != 1:
+        parser.error("--jobs cannot be combined with --io-concurrency "
+                     "(reads overlap on threads; parsing stays in one process)")
+    if args.since and not args.merge:
+        parser.error("--since requires --merge (otherwise older exercises would be dropped)")
+    if args.watch and (args.merge or args.stats or args.progression):
+        parser.error("--merge, --stats and --progression cannot be combined with --watch")
+    return args
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+    vault = args.vault
     workouts_dir = vault / WORKOUTS_FOLDER
-    output_file = vault / OUTPUT_PATH
+    output_file = vault / args.output
 
     if not workouts_dir.exists():
         print(f"❌ Workouts folder not found: {workouts_dir}")
         sys.exit(1)
 
-    # Get all workout .md files, sorted oldest → newest (so latest overwrites)
-    workout_files = sorted(
-        [f for f in workouts_dir.glob("*.md") if re.match(r"\d{4}-\d{2}-\d{2}", f.name)],
-        key=lambda f: parse_date_from_filename(f.name)
-    )
+    names = load_exercise_names(vault)
 
-    if not workout_files:
+    if args.watch:
+        watch(workouts_dir, output_file, args.interval, args.debounce, jobs, args.recursive,
+              names)
+        return
+
+    stats = BackfillStats() if args.stats else None
+    timed = stats.stage if stats else lambda name: contextlib.nullcontext()
+
+    with timed("discovery"):
+        everything, issues = dedupe_workout_files(scan_workout_files(workouts_dir, args.recursive))
+        scanned = everything
+        if args.since:
+            scanned = [item for item in everything if item[0] >= args.since]
+        workout_files = [path for _, path, _ in scanned]
+
+    if not workout_files and not args.merge:
         print(f"❌ No dated workout files found in {workouts_dir}")
         sys.exit(1)
 
-    print(f"📂 Found {len(workout_files)} workout files in {workouts_dir}")
+    since = f" dated {args.since} or later" if args.since else ""
+    print(f"📂 Found {len(workout_files)} workout files{since} in {workouts_dir}")
+    report_duplicates(issues, args.quiet)
 
-    # Merge all files — later files overwrite earlier ones
-    store = {}
-    for wf in workout_files:
-        parsed = parse_workout_file(wf)
-        if parsed:
-            print(f"  ✅ {wf.name} → {len(parsed)} exercises")
-            store.update(parsed)
-        else:
-            print(f"  ⚠️  {wf.name} → no sets found (skipped)")
+    if args.newest_first:
+        targets = load_template_exercises(vault / TEMPLATES_FOLDER)
+        with timed("parse+merge"):
+            store, read = backfill_newest_first(workout_files, targets, jobs, stats, names)
+        missing = {names.store_key(name) for name in targets} - store.keys()
+        print(f"⏪ Newest-first: read {read} of {len(workout_files)} files, "
+              f"{len(targets) - len(missing)}/{len(targets)} template exercises resolved")
+        for name in sorted(missing):
+            print(f"  ⚠️  {name} → never logged")
+    elif args.io_concurrency:
+        with timed("parse+merge"):
+            store = merge_concurrent_reads(workout_files, args.io_concurrency, names,
+                                           on_file=None if args.quiet else report_parsed,
+                                           stats=stats)
+    else:
+        with timed("parse"):
+            if args.incremental:
+                # Refresh the manifest for every file, not just the --since
+                # window, so out-of-range files aren't dropped from it
+                all_files = [path for _, path, _ in everything]
+                cached = parse_incremental(
+                    all_files, manifest_path_for(output_file), jobs, stats,
+                    file_stats={path: st for _, path, st in everything})
+                by_path = dict(zip(all_files, cached))
+                results = [by_path[wf] for wf in workout_files]
+            else:
+                results = parse_workout_files(workout_files, jobs, stats)
+
+        # Merge all files — later files overwrite earlier ones
+        with timed("merge"):
+            store = {}
+            for wf, parsed in zip(workout_files, results):
+                if parsed:
+                    store.update(names.store_keys(parsed))
+                if not args.quiet:
+                    report_parsed(wf, parsed)
+
+    if args.merge:
+        with timed("merge-existing"):
+            # Older runs may have written aliased spellings as separate keys;
+            # oldest first, so the newest entry wins when they collapse
+            existing = names.store_keys(dict(sorted(
+                load_store(output_file).items(),
+                key=lambda kv: str(kv[1].get("updatedAt", "")) if isinstance(kv[1], dict) else "")))
+            store, replaced = merge_newer(existing, store)
+        print(f"🔀 Merged into {len(existing)} existing entries: {replaced} replaced or added")
+
+    with timed("output"):
+        written = write_store(output_file, store)
+
+    if args.progression:
+        # Always covers the whole history, even with --since / --newest-first
+        progression_file = output_file.parent / PROGRESSION_FILENAME
+        with timed("progression"):
+            prog_written, resummarized = update_progression(progression_file, everything, names)
+        print(f"📈 {progression_file}: {resummarized} files re-read, "
+              f"{'written' if prog_written else 'unchanged'}")
+
+    if written:
+        print(f"\n✅ Written {len(store)} exercises to {output_file}")
+    else:
+        print(f"\n⏸  {output_file} already up to date ({len(store)} exercises), not written")
+    if not args.quiet:
+        print("\n📋 Preview:")
+        for name, data in sorted(store.items()):
+            print(f"  {name:40s} → {data['weight']} × {data['reps']}  ({data['updatedAt']})")
+
+    if stats is not None:
+        stats.extra.update(files_found=len(workout_files), exercises=len(store), written=written,
+                           duplicates=sum(i["kind"] == "duplicate" for i in issues),
+                           conflicts=[i for i in issues if i["kind"] == "conflict"])
+        write_stats_report(args.stats, stats.report())
+
+    if args.exit_code and not written:
+        sys.exit(EXIT_UNCHANGED)
+
+
+def report_parsed(wf: Path, parsed: dict[str, dict]) -> None:
+    if parsed:
+        print(f"  ✅ {wf.name} → {len(parsed)} exercises")
+    else:
+        print(f"  ⚠️  {wf.name} → no sets found (skipped)")
+
+
+def report_duplicates(issues: list[dict], quiet: bool = False) -> None:
+    """Print dedupe_workout_files() issues; conflicts are shown even with --quiet."""
+    duplicates = [i for i in issues if i["kind"] == "duplicate"]
+    if duplicates:
+        print(f"🧬 Skipped {len(duplicates)} byte-identical duplicate files")
+        if not quiet:
+            for issue in duplicates:
+                print(f"  ↳ {issue['dropped']} (same as {issue['kept']})")
+    for issue in issues:
+        if issue["kind"] == "conflict":
+            print(f"  ⚠️  Conflict copy {issue['dropped']} differs from {issue['kept']} — "
+                  f"using {issue['kept']}, merge by hand if needed")
 
-    # Write output
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(dict(sorted(store.items())), f, indent=2, ensure_ascii=False)
 
-    print(f"\n✅ Written {len(store)} exercises to {output_file}")
-    print("\n📋 Preview:")
-    for name, data in sorted(store.items()):
-        print(f"  {name:40s} → {data['weight']} × {data['reps']}  ({data['updatedAt']})")
+def write_stats_report(dest: str, report: dict) -> None:
+    """Write the --stats report to a file path, or to stderr for "-"."""
+    text = json.dumps(report, indent=2)
+    if dest == "-":
+        print(text, file=sys.stderr)
+    else:
+        Path(dest).write_text(text + "\n", encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+bench_backfill.py
+
+Benchmarks backfill_last_weights.py against synthetic vaults written by
+generate_synthetic_vault.py.
+
+By default it times each backfill stage — discovery, parsing, merging and
+JSON output — separately at 100 / 10k / 100k files, and reports the peak
+RSS of each run. Each size runs in a fresh process so peaks don't carry
+over between sizes.
+
+With --scaling it writes N files, times parse_workout_files() at 1 → N
+worker processes, and checks that every run merges to the same store as
+the serial path.
+
+With --parser it instead compares the streaming parse_workout_file() with
+the previous read_text + splitlines implementation on a few very large
+files, reporting time and peak traced memory for each.
+
+With --latency MS it simulates a synced/network mount by sleeping MS
+milliseconds in every file read, then times the serial read → parse →
+merge path against merge_concurrent_reads() at several concurrency limits,
+and checks that each produces the same store as an ordinary local run.
+
+Usage:
+    python3 bench_backfill.py [--sizes 100,10000,100000]
+    python3 bench_backfill.py --scaling [--files 10000] [--jobs 1,2,4,8]
+    python3 bench_backfill.py --parser [--sets 200000]
+    python3 bench_backfill.py --latency 20 [--files 500] [--concurrency 1,8,32,64]
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from backfill_last_weights import (
+    SET_RE,
+    find_workout_files,
+    merge_concurrent_reads,
+    merge_results,
+    parse_date_from_filename,
+    parse_workout_bytes,
+    parse_workout_file,
+    parse_workout_files,
+    write_store,
+)
+from generate_synthetic_vault import SESSIONS, VaultSpec, write_vault
+
+def write_large_file(path: Path, n_sets: int, seed: int = 0) -> None:
+    """Write one workout file with n_sets set lines plus interleaved prose."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("---\ndate: 2026-02-13\ncategories:\n  - \"[[workouts]]\"\n")
+        f.write("muscles:\n" + "".join(f'  - "[[m{i}]]"\n' for i in range(50)) + "---\n\n")
+        for i in range(n_sets):
+            if i % 4 == 0:
+                f.write(f"\n### {rng.choice(SESSIONS['chest'])}\n")
+                f.write("Felt strong today, focus on tempo and full range of motion.\n")
+            f.write(f"- [x] {rng.randrange(20, 300, 5)}lbs × {rng.randint(4, 15)}\n")
+
+
+def parse_workout_file_readall(path: Path) -> dict[str, dict]:
+    """The pre-streaming parser (read_text + splitlines), kept for comparison."""
+    text = path.read_text(encoding="utf-8")
+    date_str = parse_date_from_filename(path.name)
+    results = {}
+    current_exercise = None
+    for line in text.splitlines():
+        if line.startswith("### "):
+            current_exercise = line[4:].strip()
+            continue
+        if current_exercise:
+            m = SET_RE.match(line)
+            if m:
+                results[current_exercise] = {
+                    "weight": m.group(1).strip(),
+                    "reps": int(m.group(2)),
+                    "updatedAt": date_str
+                }
+    return results
+
+
+def bench_parser(n_sets: int, repeat: int = 3) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "2026-02-13-huge.md"
+        write_large_file(path, n_sets)
+        size_mb = path.stat().st_size / 1e6
+        print(f"Synthetic file: {n_sets} sets, {size_mb:.1f} MB\n")
+        print(f"{'parser':>10} {'best s':>8} {'peak MB':>8}")
+
+        expected = None
+        for label, fn in (("readall", parse_workout_file_readall),
+                          ("streaming", parse_workout_file)):
+            best = min(_timed(fn, path) for _ in range(repeat))
+            tracemalloc.start()
+            result = fn(path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            expected = expected or result
+            assert result == expected, f"{label} returned a different result"
+            print(f"{label:>10} {best:>8.3f} {peak / 1e6:>8.2f}")
+
+
+def _timed(fn, path: Path) -> float:
+    t0 = time.perf_counter()
+    fn(path)
+    return time.perf_counter() - t0
+
+
+def run_stages(vault: Path) -> dict[str, float]:
+    """Time each backfill stage once; runs inside a fresh worker process."""
+    timings = {}
+    t0 = time.perf_counter()
+    workout_files = find_workout_files(vault / "workouts")
+    timings["discovery"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    results = parse_workout_files(workout_files)
+    timings["parsing"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    store = merge_results(workout_files, {wf.name: r for wf, r in zip(workout_files, results)})
+    timings["merging"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    write_store(vault / "last-weights.json", store)
+    timings["output"] = time.perf_counter() - t0
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings["peak_rss_mb"] = rss / (1e6 if sys.platform == "darwin" else 1024)
+    return timings
+
+
+def bench_stages(sizes: list[int]) -> None:
+    stages = ["discovery", "parsing", "merging", "output"]
+    print(f"{'files':>8} " + " ".join(f"{s:>10}" for s in stages) + f" {'total':>8} {'peak RSS':>9}")
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            write_vault(Path(tmp), VaultSpec(files=n))
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                t = pool.submit(run_stages, Path(tmp)).result()
+        total = sum(t[s] for s in stages)
+        print(f"{n:>8} " + " ".join(f"{t[s]:>9.3f}s" for s in stages)
+              + f" {total:>7.3f}s {t['peak_rss_mb']:>7.1f}MB")
+
+
+def bench_latency(n_files: int, latency_ms: float, limits: list[int]) -> None:
+    delay = latency_ms / 1000
+
+    def slow_read(path: Path) -> bytes:
+        time.sleep(delay)           # blocks like a network read, GIL released
+        return path.read_bytes()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_vault(Path(tmp), VaultSpec(files=n_files))
+        paths = find_workout_files(Path(tmp) / "workouts")
+        expected = merge(parse_workout_files(paths))
+        print(f"{len(paths)} files, {latency_ms:g} ms injected per read\n")
+        print(f"{'reader':>12} {'seconds':>9} {'files/s':>10} {'speedup':>8}")
+
+        t0 = time.perf_counter()
+        store = merge(parse_workout_bytes(p, slow_read(p)) for p in paths)
+        serial = time.perf_counter() - t0
+        assert store == expected, "serial slow reads produced a different store"
+        print(f"{'serial':>12} {serial:>9.3f} {len(paths) / serial:>10.0f} {1:>7.2f}x")
+
+        for limit in limits:
+            t0 = time.perf_counter()
+            store = merge_concurrent_reads(paths, limit, read=slow_read)
+            elapsed = time.perf_counter() - t0
+            assert store == expected, f"concurrency={limit} produced a different store"
+            print(f"{f'async x{limit}':>12} {elapsed:>9.3f} {len(paths) / elapsed:>10.0f} "
+                  f"{serial / elapsed:>7.2f}x")
+
+
+def merge(results: Iterable[dict[str, dict]]) -> dict[str, dict]:
+    store = {}
+    for parsed in results:
+        store.update(parsed)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", default="100,10000,100000",
+                        help="comma-separated vault sizes for the stage benchmark")
+    parser.add_argument("--scaling", action="store_true",
+                        help="benchmark parse throughput at 1 → N worker processes")
+    parser.add_argument("--files", type=int, default=None,
+                        help="vault size for --scaling (default: 10000) "
+                             "or --latency (default: 500)")
+    parser.add_argument("--jobs", default=None,
+                        help="comma-separated worker counts for --scaling "
+                             "(default: 1,2,4… up to CPU count)")
+    parser.add_argument("--parser", action="store_true",
+                        help="benchmark streaming vs. read-all parsing of one large file")
+    parser.add_argument("--sets", type=int, default=200_000,
+                        help="set lines in the --parser file (default: 200000)")
+    parser.add_argument("--latency", type=float, metavar="MS",
+                        help="benchmark concurrent vs. serial reads with MS ms added per read")
+    parser.add_argument("--concurrency", default="1,8,32,64",
+                        help="comma-separated read limits for --latency (default: 1,8,32,64)")
+    args = parser.parse_args()
+
+    if args.parser:
+        bench_parser(args.sets)
+        return
+    if args.latency is not None:
+        bench_latency(args.files or 500, args.latency,
+                      [int(c) for c in args.concurrency.split(",")])
+        return
+    if not args.scaling:
+        bench_stages([int(n) for n in args.sizes.split(",")])
+        return
+
+    cpus = os.cpu_count() or 1
+    if args.jobs:
+        job_counts = [int(j) for j in args.jobs.split(",")]
+    else:
+        job_counts = [1]
+        while job_counts[-1] * 2 <= cpus:
+            job_counts.append(job_counts[-1] * 2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = args.files or 10_000
+        print(f"Generating {files} workout files…")
+        paths = write_vault(Path(tmp), VaultSpec(files=files))
+
+        baseline = None
+        baseline_time = None
+        print(f"\n{'jobs':>5} {'seconds':>9} {'files/s':>10} {'speedup':>8}")
+        for jobs in job_counts:
+            t0 = time.perf_counter()
+            store = merge(parse_workout_files(paths, jobs))
+            elapsed = time.perf_counter() - t0
+            if baseline is None:
+                baseline, baseline_time = store, elapsed
+            assert store == baseline, f"jobs={jobs} produced a different store"
+            print(f"{jobs:>5} {elapsed:>9.3f} {len(paths) / elapsed:>10.0f} "
+                  f"{baseline_time / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
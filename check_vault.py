@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+check_vault.py
+
+Validates every workout file in the vault's workouts/ folder and prints
+line-precise diagnostics (`workouts/2026-02-13-chest.md:14: error: …`):
+
+  - frontmatter: present and closed, `date` and `categories` set, no
+    duplicate or unknown keys, numeric `effort` (0–10), `duration`, `time`
+  - filename: a real calendar date that matches frontmatter `date`
+  - set lines: every `- [ ]` line under a `### ` header matches the set
+    grammar the backfill uses (SET_RE), with a weight parse_weight()
+    understands; headers with no set lines at all
+  - orphans: exercises that no templates/w-*-t.md lists (after alias and
+    case/whitespace canonicalization), reported once at their latest use
+  - sync copies: a conflict copy that differs from the file the backfill
+    reads is an error, a byte-identical duplicate a warning
+
+Files are streamed through the backfill's own skip_frontmatter() and
+iter_body_lines() (the walk behind iter_set_lines()), so a line is judged
+exactly as the parser reads it, across --jobs worker processes. Files that had no
+errors are remembered in .obsidian/check.manifest.json (mtime, size, hash,
+warnings and exercise headers), so a warm run stats each file and re-reads
+only new, changed or previously broken ones — fast enough for a pre-sync
+hook.
+
+Exits 1 if any file has an error (or, with --strict, a warning).
+
+Usage:
+    python3 check_vault.py [vault_path] [--jobs N] [--strict] [--no-cache] [--recursive]
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from backfill_last_weights import (
+    DEFAULT_VAULT,
+    OUTPUT_PATH,
+    TEMPLATES_FOLDER,
+    WORKOUTS_FOLDER,
+    dedupe_workout_files,
+    is_real_date,
+    iter_body_lines,
+    load_exercise_names,
+    load_template_exercises,
+    parse_weight,
+    refresh_manifest_entry,
+    scan_workout_files,
+    skip_frontmatter,
+    write_if_changed,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+CHECK_MANIFEST_FILENAME = "check.manifest.json"
+CHECK_VERSION = 2   # bump when the rules change, so cached results are re-checked
+
+# Keys MarkdownWriter writes (workout, hike and recovery frontmatter)
+KNOWN_KEYS = {"date", "categories", "muscles", "effort", "duration", "distance", "time", "type"}
+REQUIRED_KEYS = ("date", "categories")
+LIST_KEYS = {"categories", "muscles"}
+
+SET_PREFIX_RE = re.compile(r"\s*-\s+\[")             # lines the parser tries SET_RE on
+EMPTY_SET_RE = re.compile(r"\s*-\s+\[[ x]\]\s*$", re.IGNORECASE)   # app's "no sets" line
+KEY_RE = re.compile(r"([A-Za-z_][\w-]*):(.*)$")
+
+# (line, severity, message); line 0 = the file as a whole
+Diagnostic = tuple[int, str, str]
+
+# ── Per-file checks ───────────────────────────────────────────────────────────
+
+def check_frontmatter(f, file_date: str | None) -> tuple[list[Diagnostic], int]:
+    """
+    Validate the leading `---` block of an open file, consuming it with
+    skip_frontmatter(). Returns (diagnostics, body_lineno), the number of
+    the first body line; 1 if there is no complete block, in which case
+    the file is back at its start, as the parser sees it.
+    """
+    block = skip_frontmatter(f)
+    if block is None:
+        closed = f.readline().rstrip("\r\n") != "---"
+        f.seek(0)
+        return [(1, "error", "missing frontmatter block" if closed
+                 else "frontmatter block is never closed")], 1
+
+    diags: list[Diagnostic] = []
+    keys: dict[str, tuple[int, str]] = {}    # key → (line, scalar value)
+    items: dict[str, list[str]] = {}
+    key = None
+    for lineno, line in enumerate(block, 2):
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("- ") and key is not None:
+            items.setdefault(key, []).append(
+                stripped[2:].strip().strip("\"'").removeprefix("[[").removesuffix("]]"))
+            continue
+        m = KEY_RE.match(line)
+        if not m:
+            diags.append((lineno, "error", f"unparseable frontmatter line {stripped!r}"))
+            continue
+        key = m.group(1)
+        if key in keys:
+            diags.append((lineno, "error",
+                          f"duplicate frontmatter key {key!r} (first on line {keys[key][0]})"))
+        elif key not in KNOWN_KEYS:
+            diags.append((lineno, "warning", f"unknown frontmatter key {key!r}"))
+        keys.setdefault(key, (lineno, m.group(2).strip()))
+
+    for required in REQUIRED_KEYS:
+        if required not in keys:
+            diags.append((1, "error", f"frontmatter is missing {required!r}"))
+
+    if "date" in keys:
+        lineno, value = keys["date"]
+        if not _is_iso_date(value):
+            diags.append((lineno, "error", f"date {value!r} is not YYYY-MM-DD"))
+        elif file_date and value != file_date:
+            diags.append((lineno, "error", f"date {value} does not match the filename ({file_date})"))
+
+    for key in LIST_KEYS & keys.keys():
+        lineno, value = keys[key]
+        if value:
+            diags.append((lineno, "warning", f"{key!r} should be a list of `  - ` items"))
+    if "categories" in keys and "workouts" not in items.get("categories", []):
+        diags.append((keys["categories"][0], "warning", "categories does not include [[workouts]]"))
+
+    for key, high in (("effort", 10), ("duration", None), ("time", None)):
+        if key in keys:
+            lineno, value = keys[key]
+            if not value.isdigit() or (high is not None and int(value) > high):
+                expected = f"an integer 0–{high}" if high is not None else "whole minutes"
+                diags.append((lineno, "error", f"{key} {value!r} should be {expected}"))
+    return diags, len(block) + 3     # opening ---, block, closing ---
+
+
+def check_body(lines: Iterable[str], lineno: int = 1) -> tuple[list[Diagnostic], list[tuple[str, int]]]:
+    """
+    Validate set lines the way parse_workout_file() reads them, from
+    iter_body_lines(); `lineno` is the number of the first body line.
+    Returns (diagnostics, [(exercise, header line)] in file order, first
+    use only).
+    """
+    diags: list[Diagnostic] = []
+    headers: dict[str, int] = {}
+    current = None
+    header_line = sets = 0
+    placeholder = False
+
+    def close_exercise() -> None:
+        if current and not sets and not placeholder:
+            diags.append((header_line, "warning", f"no set lines under {current!r}"))
+
+    for lineno, exercise, line, is_header, m in iter_body_lines(lines, lineno):
+        if is_header:
+            close_exercise()
+            current, header_line, sets, placeholder = exercise, lineno, 0, False
+            if not current:
+                diags.append((lineno, "error", "empty exercise header"))
+            elif current in headers:
+                diags.append((lineno, "warning", f"{current!r} repeated (first on line "
+                              f"{headers[current]}); only its last set line is used"))
+            else:
+                headers[current] = lineno
+            continue
+        if not SET_PREFIX_RE.match(line):
+            continue
+        if exercise is None:
+            diags.append((lineno, "warning", "set line before any ### header is ignored"))
+            continue
+        if not exercise:
+            continue    # under an empty header, already reported
+        if m:
+            sets += 1
+            weight = parse_weight(m.group(1))
+            if weight.value is None and not weight.is_bodyweight:
+                diags.append((lineno, "warning", f"unrecognized weight {m.group(1).strip()!r}"))
+        elif EMPTY_SET_RE.match(line):
+            placeholder = True
+        else:
+            diags.append((lineno, "error",
+                          f"malformed set line {line.strip()!r} (expected `- [x] WEIGHT × REPS`)"))
+    close_exercise()
+    return diags, list(headers.items())
+
+
+def check_workout_file(path: Path) -> tuple[list[Diagnostic], list[tuple[str, int]]]:
+    """All file-local checks for one workout file: (diagnostics, exercises)."""
+    diags: list[Diagnostic] = []
+    file_date = path.name[:10]
+    if not _is_iso_date(file_date):
+        diags.append((0, "error", f"filename date {file_date} is not a real date"))
+        file_date = None
+    elif not path.name[10:11] == "-" or len(path.name) <= len("yyyy-mm-dd-.md"):
+        diags.append((0, "warning", "filename should be yyyy-MM-dd-{slug}.md"))
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            front, body_lineno = check_frontmatter(f, file_date)
+            body, exercises = check_body(f, body_lineno)
+    except UnicodeDecodeError as e:
+        return diags + [(0, "error", f"not valid UTF-8: {e.reason} at byte {e.start}")], []
+    except OSError as e:
+        return diags + [(0, "error", f"could not read the file: {e.strerror or e}")], []
+    return diags + front + body, exercises
+
+
+def check_workout_files(
+    paths: list[Path], jobs: int = 1
+) -> list[tuple[list[Diagnostic], list[tuple[str, int]]]]:
+    """check_workout_file() over many files, in order, chunked across processes."""
+    if jobs <= 1 or len(paths) < 2:
+        return [check_workout_file(p) for p in paths]
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(check_workout_file, paths, chunksize=chunksize))
+
+
+def _is_iso_date(value: str) -> bool:
+    return len(value) == 10 and is_real_date(value)
+
+# ── Cache ─────────────────────────────────────────────────────────────────────
+
+def load_check_manifest(path: Path) -> dict[str, dict]:
+    """{ filename: { mtime, size, sha256, warnings, exercises } }; {} if stale."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CHECK_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def check_vault(
+    scanned: list[tuple[str, Path, os.stat_result]], manifest_file: Path | None, jobs: int = 1
+) -> tuple[dict[Path, list[Diagnostic]], dict[Path, list[tuple[str, int]]], int]:
+    """
+    Run the file-local checks, reusing cached results for files that passed
+    before and are unchanged. Returns (diagnostics, exercises, files_read),
+    each keyed by path. Only files without errors are cached.
+    """
+    previous = load_check_manifest(manifest_file) if manifest_file else {}
+    manifest: dict[str, dict] = {}
+    diagnostics: dict[Path, list[Diagnostic]] = {}
+    exercises: dict[Path, list[tuple[str, int]]] = {}
+    stale = []
+    for _, path, st in scanned:
+        cached = previous.get(path.name)
+        try:
+            entry, needs_check = refresh_manifest_entry(path, cached, st)
+        except OSError:
+            entry, needs_check = None, True     # check_workout_file() reports it
+        if needs_check:
+            stale.append((path, entry))
+            continue
+        manifest[path.name] = entry
+        diagnostics[path] = [tuple(d) for d in entry["warnings"]]
+        exercises[path] = [tuple(e) for e in entry["exercises"]]
+
+    results = check_workout_files([path for path, _ in stale], jobs)
+    for (path, entry), (diags, names) in zip(stale, results):
+        diagnostics[path], exercises[path] = diags, names
+        if entry is not None and not any(severity == "error" for _, severity, _ in diags):
+            manifest[path.name] = {**entry, "warnings": diags, "exercises": names}
+
+    if manifest_file is not None:
+        encoded = json.dumps({"version": CHECK_VERSION, "files": manifest},
+                             ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        write_if_changed(manifest_file, encoded)
+    return diagnostics, exercises, len(stale)
+
+
+def find_orphans(
+    vault: Path, scanned: list[tuple[str, Path, os.stat_result]],
+    exercises: dict[Path, list[tuple[str, int]]],
+) -> dict[Path, list[Diagnostic]]:
+    """
+    One warning per exercise no template lists, at its latest header.
+    Skipped (empty) when the vault has no templates.
+    """
+    templates_dir = vault / TEMPLATES_FOLDER
+    templates = load_template_exercises(templates_dir) if templates_dir.is_dir() else set()
+    if not templates:
+        return {}
+    names = load_exercise_names(vault, sorted(templates))
+    known = {names.canonical(t) for t in templates}
+
+    latest: dict[str, tuple[Path, int]] = {}
+    uses: dict[str, int] = {}
+    for _, path, _ in scanned:           # oldest → newest, so the last use wins
+        for name, lineno in exercises.get(path, ()):
+            canonical = names.canonical(name)
+            if canonical not in known:
+                latest[canonical] = (path, lineno)
+                uses[canonical] = uses.get(canonical, 0) + 1
+
+    orphans: dict[Path, list[Diagnostic]] = {}
+    for canonical, (path, lineno) in latest.items():
+        orphans.setdefault(path, []).append((lineno, "warning",
+            f"{canonical!r} is not in any template ({uses[canonical]} "
+            f"file{'' if uses[canonical] == 1 else 's'}; "
+            f"add an alias with exercise_aliases.py if it was renamed)"))
+    return orphans
+
+def sync_copy_diagnostics(
+    scanned: list[tuple[str, Path, os.stat_result]], issues: list[dict]
+) -> dict[Path, list[Diagnostic]]:
+    """
+    dedupe_workout_files() issues as diagnostics on the copies it skipped:
+    a conflict copy with different content is an error (its sets are never
+    read), a byte-identical duplicate a warning.
+    """
+    paths = {path.name: path for _, path, _ in scanned}
+    diagnostics: dict[Path, list[Diagnostic]] = {}
+    for issue in issues:
+        if issue["kind"] == "conflict":
+            diag = (0, "error", f"conflict copy differs from {issue['kept']}, which is the "
+                                f"file that gets read; merge it by hand and delete it")
+        else:
+            diag = (0, "warning", f"byte-identical duplicate of {issue['kept']}, skipped")
+        diagnostics.setdefault(paths[issue["dropped"]], []).append(diag)
+    return diagnostics
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Validate frontmatter, filenames, set lines and exercise names "
+                    "of every workout file."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="check files in N worker processes (0 = one per CPU)")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit with status 1 on warnings too")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"re-check every file and leave {CHECK_MANIFEST_FILENAME} alone")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="also scan subfolders of workouts/")
+    args = parser.parse_args(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    workouts_dir = args.vault / WORKOUTS_FOLDER
+    if not workouts_dir.exists():
+        print(f"❌ Workouts folder not found: {workouts_dir}")
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    everything = scan_workout_files(workouts_dir, args.recursive, keep_impossible_dates=True)
+    scanned, issues = dedupe_workout_files(everything)
+    manifest_file = None if args.no_cache else (
+        (args.vault / OUTPUT_PATH).parent / CHECK_MANIFEST_FILENAME)
+    diagnostics, exercises, read = check_vault(scanned, manifest_file, jobs)
+    for extra in (find_orphans(args.vault, scanned, exercises),
+                  sync_copy_diagnostics(everything, issues)):
+        for path, diags in extra.items():
+            diagnostics[path] = diagnostics.get(path, []) + diags
+    elapsed = time.perf_counter() - t0
+
+    errors = warnings = 0
+    for _, path, _ in everything:
+        rel = path.relative_to(args.vault).as_posix()
+        for lineno, severity, message in sorted(diagnostics.get(path, ())):
+            print(f"{rel}:{lineno}: {severity}: {message}" if lineno else
+                  f"{rel}: {severity}: {message}")
+            if severity == "error":
+                errors += 1
+            else:
+                warnings += 1
+
+    status = "❌" if errors else "⚠️ " if warnings else "✅"
+    skipped = f", {len(issues)} sync copies skipped" if issues else ""
+    print(f"\n{status} {len(scanned)} files checked ({read} read, {len(scanned) - read} cached"
+          f"{skipped}) in {elapsed:.2f}s: {errors} errors, {warnings} warnings")
+    if errors or (args.strict and warnings):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+compile_templates.py
+
+Precompiles every templates/w-*-t.md into one catalog file,
+.obsidian/templates.json, so TemplatePickerView loads the picker with one
+file read instead of reading and parsing each template.
+
+Each entry carries the template's slug, display name, exercises with
+vault-relative video paths, and the file's mtime, size and sha256. Only
+templates whose content changed since the last run are re-parsed.
+Referenced videos are checked on every run and missing ones reported.
+
+Usage:
+    python3 compile_templates.py [vault_path] [--templates-folder NAME] [--strict]
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import json
+import posixpath
+import sys
+from pathlib import Path
+
+from backfill_last_weights import (
+    DEFAULT_VAULT,
+    OUTPUT_PATH,
+    TEMPLATES_FOLDER,
+    refresh_manifest_entry,
+    write_if_changed,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+#
+# templates.json (schema version 1), next to last-weights.json:
+#
+#   {
+#     "version": 1,
+#     "templatesFolder": "templates",
+#     "templates": [                         // sorted by file, like listFiles
+#       { "file": "w-chest-t.md", "slug": "chest", "displayName": "Chest",
+#         "mtime": 1771000000000000000,      // st_mtime_ns
+#         "size": 120, "sha256": "…",
+#         "exercises": [
+#           { "name": "Chest press", "video": null, "videoExists": false },
+#           { "name": "Loaded stretching chest + shoulder",
+#             "video": "videos/chest.mov",   // vault-relative
+#             "videoExists": true }
+#         ] }
+#     ]
+#   }
+#
+# The app uses an entry only while the template's modification date still
+# matches `mtime`; otherwise it parses that file itself.
+
+CATALOG_FILENAME = "templates.json"
+CATALOG_VERSION = 1
+
+# ── Parsing ───────────────────────────────────────────────────────────────────
+
+def template_slug(filename: str) -> str:
+    """w-hams-glutes-t.md → hams-glutes"""
+    return filename.removeprefix("w-").removesuffix("-t.md")
+
+
+def display_name(filename: str) -> str:
+    """Mirrors WorkoutTemplate.displayName: "w-hams-glutes-t.md" → "Hams Glutes"."""
+    return " ".join(part[:1].upper() + part[1:].lower()
+                    for part in template_slug(filename).split("-") if part)
+
+
+def resolve_video(templates_folder: str, link: str) -> str:
+    """
+    A `[video](path)` target, resolved like MarkdownParser.extractVideoURL
+    (relative to the template's folder), as a normalized vault-relative path.
+    """
+    return posixpath.normpath(posixpath.join(templates_folder, link.lstrip("/")))
+
+
+def parse_template(path: Path, templates_folder: str) -> list[dict]:
+    """
+    Mirrors MarkdownParser.parseTemplate: top-level `- Name` lines are
+    exercises; an indented `- [video](path)` line attaches a video to the
+    exercise above it.
+    """
+    exercises = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line.startswith("- "):
+                exercises.append({"name": line[2:].strip(), "video": None})
+            elif line.startswith(("  - ", "\t- ")) and exercises:
+                sub = line.strip()[2:]
+                open_, close = sub.find("("), sub.rfind(")")
+                if 0 <= open_ < close:
+                    exercises[-1]["video"] = resolve_video(templates_folder, sub[open_ + 1:close])
+    return exercises
+
+# ── Catalog ───────────────────────────────────────────────────────────────────
+
+def load_catalog(path: Path, templates_folder: str) -> dict[str, dict]:
+    """
+    Previous catalog entries by filename; {} if missing, another version or
+    compiled for another templates folder (video paths depend on it).
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(data, dict) or data.get("version") != CATALOG_VERSION
+            or data.get("templatesFolder") != templates_folder):
+        return {}
+    return {entry["file"]: entry for entry in data.get("templates", [])
+            if isinstance(entry, dict) and "file" in entry}
+
+
+def compile_catalog(
+    vault: Path, catalog_file: Path, templates_folder: str = TEMPLATES_FOLDER
+) -> tuple[dict, int, list[tuple[str, str, str]]]:
+    """
+    Rebuild the catalog, re-parsing only templates whose mtime/size and then
+    content hash changed. Returns (catalog, templates_reparsed, missing)
+    where missing lists (template, exercise, video) for absent videos.
+    """
+    previous = load_catalog(catalog_file, templates_folder)
+    templates_dir = vault / templates_folder
+    entries = []
+    reparsed = 0
+    missing = []
+
+    for tf in sorted(templates_dir.glob("w-*-t.md")):
+        cached = previous.get(tf.name)
+        stamp, needs_parse = refresh_manifest_entry(tf, cached)
+        if needs_parse:
+            exercises = parse_template(tf, templates_folder)
+            reparsed += 1
+        else:
+            exercises = cached["exercises"]
+
+        for exercise in exercises:
+            video = exercise.get("video")
+            exercise["videoExists"] = bool(video) and (vault / video).is_file()
+            if video and not exercise["videoExists"]:
+                missing.append((tf.name, exercise["name"], video))
+
+        entries.append({
+            "file": tf.name,
+            "slug": template_slug(tf.name),
+            "displayName": display_name(tf.name),
+            "mtime": stamp["mtime"],
+            "size": stamp["size"],
+            "sha256": stamp["sha256"],
+            "exercises": exercises,
+        })
+
+    catalog = {"version": CATALOG_VERSION, "templatesFolder": templates_folder,
+               "templates": entries}
+    return catalog, reparsed, missing
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Precompile workout templates into one catalog file for the app."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--templates-folder", default=TEMPLATES_FOLDER, metavar="NAME",
+                        help=f"templates folder inside the vault, as set in the app "
+                             f"(default: {TEMPLATES_FOLDER})")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit with status 1 if any referenced video is missing")
+    args = parser.parse_args(argv)
+
+    templates_dir = args.vault / args.templates_folder
+    if not templates_dir.exists():
+        print(f"❌ Templates folder not found: {templates_dir}")
+        sys.exit(1)
+
+    catalog_file = (args.vault / OUTPUT_PATH).parent / CATALOG_FILENAME
+    catalog, reparsed, missing = compile_catalog(args.vault, catalog_file, args.templates_folder)
+    encoded = json.dumps(catalog, indent=2, ensure_ascii=False).encode("utf-8")
+    written = write_if_changed(catalog_file, encoded)
+
+    count = len(catalog["templates"])
+    print(f"📚 {count} templates ({reparsed} re-parsed) → {catalog_file}"
+          f"{'' if written else ' (unchanged, not written)'}")
+    for template, exercise, video in missing:
+        print(f"  ⚠️  {template}: {exercise} → missing video {video}")
+
+    if args.strict and missing:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
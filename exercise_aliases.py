@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+exercise_aliases.py
+
+Finds exercise names in the vault's workouts/ folder that are probably the
+same exercise and manages the alias file, .obsidian/exercise-aliases.json,
+that backfill_last_weights.py and the history tools apply.
+
+Spellings that differ only in case or whitespace ("Chest press",
+"chest  Press ") are merged automatically and listed for information.
+Beyond that, merges are suggested from a trigram index: each canonical
+name is split into padded character trigrams, an inverted index maps
+trigram → names, and only names sharing a trigram are scored (Jaccard
+similarity of their trigram sets), so thousands of distinct names never
+need an all-pairs comparison. Suggestions are never applied on their own;
+record the ones you agree with with --add.
+
+Usage:
+    python3 exercise_aliases.py [vault_path] [--threshold 0.5] [--recursive]
+    python3 exercise_aliases.py [vault_path] --add "chest pres=Chest press" [--add …]
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from backfill_last_weights import (
+    ALIASES_PATH,
+    DEFAULT_VAULT,
+    TEMPLATES_FOLDER,
+    WORKOUTS_FOLDER,
+    dedupe_workout_files,
+    fold_name,
+    iter_workout_sets,
+    load_aliases,
+    load_exercise_names,
+    load_template_exercises,
+    scan_workout_files,
+    write_if_changed,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+DEFAULT_THRESHOLD = 0.5
+
+# ── Names ─────────────────────────────────────────────────────────────────────
+
+def count_spellings(workouts_dir: Path, recursive: bool = False) -> dict[str, int]:
+    """{ raw `### ` header text: number of sessions it appears in }"""
+    counts: dict[str, int] = {}
+    scanned, _ = dedupe_workout_files(scan_workout_files(workouts_dir, recursive))
+    for _, path, _ in scanned:
+        for name in {name for name, _, _, _ in iter_workout_sets(path)}:
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def trigrams(name: str) -> set[str]:
+    """Character trigrams of the folded name, padded so word edges count."""
+    padded = f"  {fold_name(name)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def suggest_merges(
+    counts: dict[str, int], threshold: float = DEFAULT_THRESHOLD,
+    preferred: set[str] = frozenset(),
+) -> list[tuple[float, str, str]]:
+    """
+    (similarity, alias, canonical) pairs of canonical names whose trigram
+    Jaccard similarity is at least `threshold`, best first. A `preferred`
+    (template) name is always proposed as the canonical side; otherwise the
+    name logged in fewer sessions becomes the alias of the other.
+    """
+    def rank(name: str) -> tuple[bool, int]:
+        return name in preferred, counts[name]
+
+    names = sorted(counts)
+    grams = [trigrams(name) for name in names]
+    index: dict[str, list[int]] = {}
+    for i, gs in enumerate(grams):
+        for g in gs:
+            index.setdefault(g, []).append(i)
+
+    suggestions = []
+    for i, gs in enumerate(grams):
+        shared: dict[int, int] = {}
+        for g in gs:
+            for j in index[g]:
+                if j > i:
+                    shared[j] = shared.get(j, 0) + 1
+        for j, common in shared.items():
+            score = common / (len(gs) + len(grams[j]) - common)
+            if score < threshold:
+                continue
+            a, b = names[i], names[j]
+            alias, canonical = (a, b) if (rank(a), b) < (rank(b), a) else (b, a)
+            suggestions.append((score, alias, canonical))
+    suggestions.sort(key=lambda s: (-s[0], s[2], s[1]))
+    return suggestions
+
+# ── Alias file ────────────────────────────────────────────────────────────────
+
+def parse_alias_arg(value: str) -> tuple[str, str]:
+    alias, sep, canonical = value.partition("=")
+    if not sep or not alias.strip() or not canonical.strip():
+        raise argparse.ArgumentTypeError(f"expected ALIAS=CANONICAL, got {value!r}")
+    return " ".join(alias.split()), " ".join(canonical.split())
+
+
+def save_aliases(path: Path, aliases: dict[str, str]) -> bool:
+    """Write the alias file sorted by alias; returns False if unchanged."""
+    ordered = dict(sorted(aliases.items(), key=lambda kv: fold_name(kv[0])))
+    encoded = json.dumps(ordered, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
+    return write_if_changed(path, encoded)
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Suggest exercise-name merges and manage the alias file."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="0-1",
+                        help=f"minimum trigram similarity to suggest a merge "
+                             f"(default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--add", type=parse_alias_arg, action="append", default=[],
+                        metavar="ALIAS=CANONICAL",
+                        help="record an alias in the alias file (repeatable)")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="also scan subfolders of workouts/")
+    args = parser.parse_args(argv)
+
+    aliases_file = args.vault / ALIASES_PATH
+    if args.add:
+        aliases = load_aliases(aliases_file)
+        for alias, canonical in args.add:
+            # Replace any existing entry that folds to the same alias
+            for key in [k for k in aliases if fold_name(k) == fold_name(alias)]:
+                del aliases[key]
+            aliases[alias] = canonical
+            print(f"  🔗 {alias} → {canonical}")
+        written = save_aliases(aliases_file, aliases)
+        print(f"\n✅ {len(aliases)} aliases in {aliases_file}"
+              f"{'' if written else ' (unchanged, not written)'}")
+        return
+
+    workouts_dir = args.vault / WORKOUTS_FOLDER
+    if not workouts_dir.exists():
+        print(f"❌ Workouts folder not found: {workouts_dir}")
+        sys.exit(1)
+
+    templates_dir = args.vault / TEMPLATES_FOLDER
+    templates = load_template_exercises(templates_dir) if templates_dir.is_dir() else set()
+    names = load_exercise_names(args.vault, sorted(templates))
+    raw_counts = count_spellings(workouts_dir, args.recursive)
+    counts: dict[str, int] = {}
+    spellings: dict[str, list[str]] = {}
+    for raw, n in raw_counts.items():
+        canonical = names.canonical(raw)
+        counts[canonical] = counts.get(canonical, 0) + n
+        spellings.setdefault(canonical, []).append(raw)
+
+    print(f"📋 {len(raw_counts)} spellings → {len(counts)} exercises")
+    merged = {c: raws for c, raws in spellings.items() if len(raws) > 1}
+    if merged:
+        print(f"\n🔡 Merged by case/whitespace or alias ({len(merged)}):")
+        for canonical, raws in sorted(merged.items()):
+            variants = ", ".join(repr(raw) for raw in sorted(raws) if raw != canonical)
+            print(f"  {canonical:40s} ← {variants}")
+
+    suggestions = suggest_merges(counts, args.threshold, templates)
+    if not suggestions:
+        print(f"\n✅ No further merges suggested at similarity ≥ {args.threshold:g}")
+        return
+    print(f"\n💡 Suggested merges ({len(suggestions)}), record with --add \"ALIAS=CANONICAL\":")
+    for score, alias, canonical in suggestions:
+        print(f"  {score:.2f}  {alias} ({counts[alias]}) → {canonical} ({counts[canonical]})")
+
+
+if __name__ == "__main__":
+    main()
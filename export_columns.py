@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+export_columns.py
+
+Exports the full set history in the vault's workouts/ folder to a compact,
+memory-mappable column file (_app_data/sets.columns) for analytics, and
+provides a small query API over it.
+
+Per set row:
+    exercise  uint16   index into the exercise dictionary (canonical names)
+    day       int32    days since 1970-01-01
+    weight    float32  pounds (kg converted); NaN = bodyweight / unparseable
+    reps      uint16
+    session   uint32   index into the per-file session columns
+
+Per session (one per workout file):
+    session_day       int32
+    muscle_offsets    uint32   CSR offsets into muscle_codes (sessions + 1)
+    muscle_codes      uint16   index into the muscle dictionary
+
+File layout: the 8-byte magic, a little-endian uint32 header length, a JSON
+header (dictionaries + {column: [typecode, byte offset, length]}), then each
+column's raw little-endian bytes at an 8-byte aligned offset. Columns load
+as zero-copy memoryviews over an mmap; numpy users can wrap the same
+offsets with np.frombuffer.
+
+Usage:
+    python3 export_columns.py [vault_path]
+    python3 export_columns.py [vault_path] --max-weight "Chest press"
+    python3 export_columns.py [vault_path] --rolling-volume 7 [--exercise NAME]
+    python3 export_columns.py [vault_path] --muscle-volume
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from backfill_last_weights import (
+    ALIASES_PATH,
+    DEFAULT_VAULT,
+    WORKOUTS_FOLDER,
+    ExerciseNames,
+    find_workout_files,
+    iter_set_lines,
+    load_aliases,
+    load_exercise_names,
+    numeric_weight,
+    parse_date_from_filename,
+    read_frontmatter,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+COLUMNS_PATH = "_app_data/sets.columns"
+MAGIC = b"WMDCOL1\n"
+EPOCH = date(1970, 1, 1)
+
+# column name → array typecode (sizes are fixed on every supported platform)
+SET_COLUMNS = {"exercise": "H", "day": "i", "weight": "f", "reps": "H", "session": "I"}
+SESSION_COLUMNS = {"session_day": "i", "muscle_offsets": "I", "muscle_codes": "H"}
+
+# ── Export ────────────────────────────────────────────────────────────────────
+
+def day_number(date_str: str) -> int:
+    return (date.fromisoformat(date_str) - EPOCH).days
+
+
+def build_columns(
+    workout_files: list[Path], names: ExerciseNames | None = None
+) -> tuple[dict, dict[str, array]]:
+    """
+    Parse every file once into typed arrays plus dictionary tables. With
+    `names`, spellings of one exercise share a dictionary code.
+    """
+    canonical = names.canonical if names else str
+    cols = {name: array(tc) for name, tc in {**SET_COLUMNS, **SESSION_COLUMNS}.items()}
+    cols["muscle_offsets"].append(0)
+    exercises: dict[str, int] = {}
+    muscles: dict[str, int] = {}
+
+    for session, wf in enumerate(workout_files):
+        day = day_number(parse_date_from_filename(wf.name))
+        with open(wf, encoding="utf-8") as f:
+            meta = read_frontmatter(f)
+            for name, weight, reps, _ in iter_set_lines(f):
+                value = numeric_weight(weight)
+                name = canonical(name)
+                cols["exercise"].append(exercises.setdefault(name, len(exercises)))
+                cols["day"].append(day)
+                cols["weight"].append(math.nan if value is None else value)
+                cols["reps"].append(min(reps, 0xFFFF))
+                cols["session"].append(session)
+
+        tags = meta.get("muscles")
+        for muscle in tags if isinstance(tags, list) else ():
+            cols["muscle_codes"].append(muscles.setdefault(muscle, len(muscles)))
+        cols["muscle_offsets"].append(len(cols["muscle_codes"]))
+        cols["session_day"].append(day)
+
+    header = {"exercises": list(exercises), "muscles": list(muscles)}
+    return header, cols
+
+
+def write_columns(path: Path, header: dict, cols: dict[str, array]) -> None:
+    if sys.byteorder != "little":
+        cols = {name: _swapped(col) for name, col in cols.items()}
+
+    # Column offsets depend on the header length, which depends on the
+    # offsets; grow the data start until the encoded header fits before it.
+    relative = {}
+    rel = 0
+    for name, col in cols.items():
+        relative[name] = rel
+        rel = _align(rel + len(col) * col.itemsize)
+
+    data_start = 0
+    while True:
+        layout = {name: [col.typecode, data_start + relative[name], len(col)]
+                  for name, col in cols.items()}
+        body_header = dict(header, version=1, rows=len(cols["exercise"]), columns=layout)
+        encoded = json.dumps(body_header, ensure_ascii=False).encode("utf-8")
+        needed = _align(len(MAGIC) + 4 + len(encoded))
+        if needed <= data_start:
+            break
+        data_start = needed
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(encoded)) + encoded)
+        for name, col in cols.items():
+            f.write(b"\0" * (layout[name][1] - f.tell()))
+            col.tofile(f)
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _swapped(col: array) -> array:
+    col = array(col.typecode, col)
+    col.byteswap()
+    return col
+
+# ── Load + query ──────────────────────────────────────────────────────────────
+
+@dataclass
+class SetColumns:
+    """Column views over a mapped sets.columns file."""
+    exercises: list[str]
+    muscles: list[str]
+    exercise: memoryview
+    day: memoryview
+    weight: memoryview
+    reps: memoryview
+    session: memoryview
+    session_day: memoryview
+    muscle_offsets: memoryview
+    muscle_codes: memoryview
+
+    def exercise_code(self, name: str) -> int | None:
+        try:
+            return self.exercises.index(name)
+        except ValueError:
+            return None
+
+
+def load_columns(path: Path) -> SetColumns:
+    """
+    Map a column file and return zero-copy views of every column.
+    On big-endian hosts the columns are copied and byte-swapped instead.
+    """
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if buf[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a sets.columns file")
+    (header_len,) = struct.unpack_from("<I", buf, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(buf[start:start + header_len])
+
+    views = {}
+    view = memoryview(buf)
+    for name, (typecode, offset, length) in header["columns"].items():
+        size = array(typecode).itemsize
+        raw = view[offset:offset + length * size]
+        if sys.byteorder == "little":
+            views[name] = raw.cast(typecode)
+        else:
+            views[name] = memoryview(_swapped(array(typecode, raw.tobytes())))
+    return SetColumns(exercises=header["exercises"], muscles=header["muscles"], **views)
+
+
+def max_weight_series(cols: SetColumns, exercise: str) -> list[tuple[date, float]]:
+    """Heaviest weighted set per day for one exercise, oldest first."""
+    code = cols.exercise_code(exercise)
+    if code is None:
+        return []
+    best: dict[int, float] = {}
+    for ex, day, weight in zip(cols.exercise, cols.day, cols.weight):
+        if ex == code and weight == weight and weight > best.get(day, -1.0):  # NaN ≠ NaN
+            best[day] = weight
+    return [(EPOCH + timedelta(days=d), w) for d, w in sorted(best.items())]
+
+
+def rolling_volume(
+    cols: SetColumns, window_days: int = 7, exercise: str | None = None
+) -> list[tuple[date, float]]:
+    """
+    Tonnage (weight × reps, bodyweight sets count as 0) summed over the
+    trailing `window_days` for every day that has sets, oldest first.
+    """
+    code = None if exercise is None else cols.exercise_code(exercise)
+    if exercise is not None and code is None:
+        return []
+    per_day: dict[int, float] = {}
+    for ex, day, weight, reps in zip(cols.exercise, cols.day, cols.weight, cols.reps):
+        if (code is None or ex == code) and weight == weight:
+            per_day[day] = per_day.get(day, 0.0) + weight * reps
+
+    days = sorted(per_day)
+    result = []
+    total = 0.0
+    tail = 0
+    for day in days:
+        total += per_day[day]
+        while days[tail] <= day - window_days:
+            total -= per_day[days[tail]]
+            tail += 1
+        result.append((EPOCH + timedelta(days=day), total))
+    return result
+
+
+def volume_by_muscle(cols: SetColumns) -> dict[str, float]:
+    """Total tonnage attributed to each frontmatter muscle of its session."""
+    per_session: dict[int, float] = {}
+    for session, weight, reps in zip(cols.session, cols.weight, cols.reps):
+        if weight == weight:
+            per_session[session] = per_session.get(session, 0.0) + weight * reps
+
+    totals: dict[str, float] = {}
+    for session, volume in per_session.items():
+        lo, hi = cols.muscle_offsets[session], cols.muscle_offsets[session + 1]
+        for code in cols.muscle_codes[lo:hi]:
+            name = cols.muscles[code]
+            totals[name] = totals.get(name, 0.0) + volume
+    return totals
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Export set history to a memory-mappable column file and query it."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--max-weight", metavar="NAME",
+                        help="print the per-day max weight series for an exercise")
+    parser.add_argument("--rolling-volume", type=int, metavar="DAYS",
+                        help="print trailing-window tonnage per training day")
+    parser.add_argument("--exercise", metavar="NAME",
+                        help="restrict --rolling-volume to one exercise")
+    parser.add_argument("--muscle-volume", action="store_true",
+                        help="print total tonnage per frontmatter muscle group")
+    args = parser.parse_args(argv)
+
+    columns_file = args.vault / COLUMNS_PATH
+    querying = args.max_weight or args.rolling_volume or args.muscle_volume
+    if not querying:
+        workouts_dir = args.vault / WORKOUTS_FOLDER
+        if not workouts_dir.exists():
+            print(f"❌ Workouts folder not found: {workouts_dir}")
+            sys.exit(1)
+        header, cols = build_columns(find_workout_files(workouts_dir),
+                                     load_exercise_names(args.vault))
+        write_columns(columns_file, header, cols)
+        size_kb = columns_file.stat().st_size / 1024
+        print(f"✅ Exported {len(cols['exercise'])} sets, {len(header['exercises'])} exercises "
+              f"→ {columns_file} ({size_kb:.1f} KB)")
+        return
+
+    if not columns_file.exists():
+        print(f"❌ No column file at {columns_file}; run without a query first")
+        sys.exit(1)
+    cols = load_columns(columns_file)
+    # Resolve query names the way the export keyed them
+    names = ExerciseNames(load_aliases(args.vault / ALIASES_PATH), preferred=cols.exercises)
+    exercise = names.canonical(args.exercise) if args.exercise else None
+    if args.max_weight:
+        for day, weight in max_weight_series(cols, names.canonical(args.max_weight)):
+            print(f"  {day}  {weight:>7g}")
+    if args.rolling_volume:
+        for day, volume in rolling_volume(cols, args.rolling_volume, exercise):
+            print(f"  {day}  {volume:>10.0f}")
+    if args.muscle_volume:
+        for muscle, volume in sorted(volume_by_muscle(cols).items(), key=lambda kv: -kv[1]):
+            print(f"  {muscle:20s} {volume:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+generate_synthetic_vault.py
+
+Writes a synthetic vault for benchmarking the Python tooling: N dated
+workout files in the completed-workout format the app saves (frontmatter,
+`## Title — date` heading, `### Exercise` sections with `- [x] w × r` sets),
+plus a matching templates/w-*-t.md file per session type.
+
+Usage:
+    python3 generate_synthetic_vault.py OUT_DIR [--files 10000]
+        [--exercises 5] [--sets 4] [--frontmatter-lines 0]
+        [--bodyweight-share 0.2] [--sessions-per-day 2] [--seed 0]
+"""
+
+import argparse
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+SESSIONS = {
+    "chest": ["Chest press", "Incline push-ups", "Eccentric push-ups", "Cable fly",
+              "Dips", "Loaded stretching chest + shoulder"],
+    "back": ["Lat pulldown", "Seated row", "Deadlift", "Face pull", "Pull-ups"],
+    "legs": ["Back squat", "Romanian deadlift", "Hip thrust", "Leg press", "Calf raise"],
+    "shoulders": ["Overhead press", "Lateral raise", "Rear delt fly", "Shrugs"],
+    "arms": ["Bicep curl", "Tricep pushdown", "Hammer curl", "Skull crushers"],
+}
+
+
+@dataclass
+class VaultSpec:
+    files: int = 10_000
+    exercises_per_session: int = 5
+    sets_per_exercise: int = 4
+    frontmatter_lines: int = 0      # extra `key: value` lines per file
+    bodyweight_share: float = 0.2
+    sessions_per_day: int = 2
+    seed: int = 0
+
+
+def workout_text(rng: random.Random, spec: VaultSpec, day: date, session: str) -> str:
+    """One completed workout file, shaped like MarkdownWriter's output."""
+    lines = [
+        "---",
+        f"date: {day.isoformat()}",
+        "categories:",
+        '  - "[[workouts]]"',
+        "muscles:",
+        f'  - "[[{session}]]"',
+        f"effort: {rng.randint(4, 10)}",
+        f"duration: {rng.randint(30, 90)}",
+    ]
+    lines += [f"note{i}: {rng.random():.6f}" for i in range(spec.frontmatter_lines)]
+    lines += ["---", "", f"## {session.title()} — {day:%b} {day.day}, {day.year}", "- Duration: 45m", ""]
+
+    pool = SESSIONS[session]
+    for name in rng.sample(pool, min(spec.exercises_per_session, len(pool))):
+        lines.append(f"### {name}")
+        for _ in range(spec.sets_per_exercise):
+            if rng.random() < spec.bodyweight_share:
+                weight = "bodyweight"
+            else:
+                weight = f"{rng.randrange(20, 300, 5)}lbs"
+            lines.append(f"- [{rng.choice('xx ')}] {weight} × {rng.randint(4, 15)}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def write_vault(root: Path, spec: VaultSpec) -> list[Path]:
+    """
+    Write spec.files workout files into root/workouts (and one template per
+    session type into root/templates). Returns the workout paths, oldest first.
+    """
+    rng = random.Random(spec.seed)
+    workouts = root / "workouts"
+    templates = root / "templates"
+    workouts.mkdir(parents=True, exist_ok=True)
+    templates.mkdir(parents=True, exist_ok=True)
+
+    for session, exercises in SESSIONS.items():
+        (templates / f"w-{session}-t.md").write_text(
+            "".join(f"- {name}\n" for name in exercises), encoding="utf-8")
+
+    start = date(2000, 1, 1)
+    # Filenames are `date-session`, so at most one of each session type per day
+    per_day = min(max(1, spec.sessions_per_day), len(SESSIONS))
+    session_names = list(SESSIONS)
+    paths = []
+    for i in range(spec.files):
+        day = start + timedelta(days=i // per_day)
+        session = session_names[i % len(session_names)]
+        path = workouts / f"{day.isoformat()}-{session}.md"
+        path.write_text(workout_text(rng, spec, day, session), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic WorkoutMD vault.")
+    parser.add_argument("out", type=Path, help="vault folder to create")
+    parser.add_argument("--files", type=int, default=VaultSpec.files)
+    parser.add_argument("--exercises", type=int, default=VaultSpec.exercises_per_session,
+                        help="exercises per session")
+    parser.add_argument("--sets", type=int, default=VaultSpec.sets_per_exercise,
+                        help="sets per exercise")
+    parser.add_argument("--frontmatter-lines", type=int, default=VaultSpec.frontmatter_lines,
+                        help="extra frontmatter lines per file")
+    parser.add_argument("--bodyweight-share", type=float, default=VaultSpec.bodyweight_share,
+                        help="fraction of sets logged as bodyweight")
+    parser.add_argument("--sessions-per-day", type=int, default=VaultSpec.sessions_per_day)
+    parser.add_argument("--seed", type=int, default=VaultSpec.seed)
+    args = parser.parse_args()
+
+    spec = VaultSpec(
+        files=args.files,
+        exercises_per_session=args.exercises,
+        sets_per_exercise=args.sets,
+        frontmatter_lines=args.frontmatter_lines,
+        bodyweight_share=args.bodyweight_share,
+        sessions_per_day=args.sessions_per_day,
+        seed=args.seed,
+    )
+    paths = write_vault(args.out, spec)
+    print(f"✅ Wrote {len(paths)} workout files to {args.out / 'workouts'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+index_history.py
+
+Builds a full-history SQLite index of every logged set in the vault's
+workouts/ folder, stored at _app_data/history.sqlite. Unlike
+last-weights.json (one entry per exercise), every set line is kept, so
+progression queries are indexed lookups instead of folder scans.
+
+Re-running only re-indexes files whose mtime/size (and then content hash)
+changed; rows for deleted files are dropped. Rows keep the raw `### `
+header text plus its case/whitespace fold (fold_name); queries map a name
+to the folded spellings its aliases cover (see exercise_aliases.py) and
+look those up in the index, so editing the alias file never needs a
+re-index.
+
+Usage:
+    python3 index_history.py [vault_path]
+    python3 index_history.py [vault_path] --exercise "Chest press"
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+
+from backfill_last_weights import (
+    DEFAULT_VAULT,
+    WORKOUTS_FOLDER,
+    ExerciseNames,
+    find_workout_files,
+    fold_name,
+    iter_workout_sets,
+    load_exercise_names,
+    numeric_weight,
+    parse_date_from_filename,
+    refresh_manifest_entry,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+INDEX_PATH = "_app_data/history.sqlite"
+INDEX_VERSION = 3   # PRAGMA user_version; 2: unit-aware weight, 3: sets.folded
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file    TEXT PRIMARY KEY,
+    date    TEXT NOT NULL,
+    mtime   INTEGER NOT NULL,
+    size    INTEGER NOT NULL,
+    sha256  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sets (
+    exercise    TEXT NOT NULL,      -- raw `### ` header text
+    folded      TEXT NOT NULL,      -- fold_name(exercise)
+    date        TEXT NOT NULL,
+    file        TEXT NOT NULL REFERENCES files(file) ON DELETE CASCADE,
+    ordinal     INTEGER NOT NULL,   -- 1-based set number within the exercise
+    weight      REAL,               -- pounds (kg converted); NULL = bodyweight / unparseable
+    weight_raw  TEXT NOT NULL,
+    reps        INTEGER NOT NULL,
+    done        INTEGER NOT NULL,
+    PRIMARY KEY (file, exercise, ordinal)
+);
+CREATE INDEX IF NOT EXISTS sets_exercise_date ON sets (exercise, date);
+CREATE INDEX IF NOT EXISTS sets_folded_date ON sets (folded, date);
+"""
+
+# ── Index ─────────────────────────────────────────────────────────────────────
+
+def open_index(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+        # Written by an older version (other rows or columns): start over so
+        # update_index() re-indexes the whole folder
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS sets")
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def set_rows(path: Path) -> list[tuple]:
+    """Rows for the sets table, in file order."""
+    date_str = parse_date_from_filename(path.name)
+    ordinals = {}
+    rows = []
+    for exercise, weight, reps, done in iter_workout_sets(path):
+        ordinals[exercise] = ordinals.get(exercise, 0) + 1
+        rows.append((exercise, fold_name(exercise), date_str, path.name, ordinals[exercise],
+                     numeric_weight(weight), weight, reps, int(done)))
+    return rows
+
+
+def update_index(conn: sqlite3.Connection, workout_files: list[Path]) -> tuple[int, int]:
+    """
+    Upsert every changed file's sets and drop files that no longer exist.
+    Returns (files_reindexed, files_removed).
+    """
+    known = {
+        row[0]: {"mtime": row[1], "size": row[2], "sha256": row[3]}
+        for row in conn.execute("SELECT file, mtime, size, sha256 FROM files")
+    }
+    reindexed = 0
+
+    with conn:
+        for wf in workout_files:
+            cached = known.pop(wf.name, None)
+            entry, needs_parse = refresh_manifest_entry(wf, cached)
+            if entry is cached:
+                continue
+            conn.execute(
+                "INSERT INTO files (file, date, mtime, size, sha256) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (file) DO UPDATE SET"
+                " date = excluded.date, mtime = excluded.mtime,"
+                " size = excluded.size, sha256 = excluded.sha256",
+                (wf.name, parse_date_from_filename(wf.name),
+                 entry["mtime"], entry["size"], entry["sha256"]),
+            )
+            if needs_parse:
+                conn.execute("DELETE FROM sets WHERE file = ?", (wf.name,))
+                conn.executemany("INSERT INTO sets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                 set_rows(wf))
+                reindexed += 1
+
+        # Anything left in `known` was deleted from the folder
+        conn.executemany("DELETE FROM files WHERE file = ?", [(f,) for f in known])
+
+    return reindexed, len(known)
+
+
+# ── Queries ───────────────────────────────────────────────────────────────────
+
+def progression(
+    conn: sqlite3.Connection, exercise: str, names: ExerciseNames | None = None
+) -> list[tuple[str, float, int]]:
+    """
+    (date, max weight, total reps) per day for one exercise — the same points
+    ExerciseProgressionView plots. Bodyweight-only days are omitted. With
+    `names`, every spelling with the same canonical name is included, found
+    through the (folded, date) index.
+    """
+    if names is None:
+        column, keys = "exercise", [exercise]
+    else:
+        column, keys = "folded", sorted(names.folded_spellings(exercise))
+    marks = ", ".join("?" * len(keys))
+    return conn.execute(
+        "SELECT date, MAX(weight), SUM(reps) FROM sets"
+        f" WHERE {column} IN ({marks}) AND weight IS NOT NULL"
+        " GROUP BY date ORDER BY date",
+        keys,
+    ).fetchall()
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Index every logged set in the vault into SQLite."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--exercise", metavar="NAME",
+                        help="after indexing, print this exercise's progression")
+    args = parser.parse_args(argv)
+
+    workouts_dir = args.vault / WORKOUTS_FOLDER
+    if not workouts_dir.exists():
+        print(f"❌ Workouts folder not found: {workouts_dir}")
+        sys.exit(1)
+
+    index_file = args.vault / INDEX_PATH
+    conn = open_index(index_file)
+    try:
+        workout_files = find_workout_files(workouts_dir)
+        reindexed, removed = update_index(conn, workout_files)
+        total_sets = conn.execute("SELECT COUNT(*) FROM sets").fetchone()[0]
+        print(f"🗂  {index_file}: {len(workout_files)} files, {total_sets} sets "
+              f"({reindexed} re-indexed, {removed} removed)")
+
+        if args.exercise:
+            points = progression(conn, args.exercise, load_exercise_names(args.vault))
+            if not points:
+                print(f"⚠️  No weighted sets logged for {args.exercise!r}")
+            for date_str, weight, reps in points:
+                print(f"  {date_str}  {weight:>7g}  ({reps} reps)")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
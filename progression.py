@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+progression.py
+
+Prints an exercise's history from the progression.json sidecar that
+`backfill_last_weights.py --progression` maintains (schema documented
+there), without touching the workout files. The cache keeps the app's
+exact header spellings; the name is matched case- and whitespace-
+insensitively and through the alias file, and every matching spelling's
+points are shown together.
+
+Usage:
+    python3 progression.py "Chest press" [--vault PATH] [--json]
+    python3 progression.py --list [--vault PATH]
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from backfill_last_weights import (
+    DEFAULT_VAULT,
+    OUTPUT_PATH,
+    PROGRESSION_FILENAME,
+    load_exercise_names,
+    load_progression,
+    merge_summary_points,
+)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Query the per-exercise progression cache."
+    )
+    parser.add_argument("exercise", nargs="?", help="exercise name, as in the ### header")
+    parser.add_argument("--vault", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--cache", type=Path, metavar="PATH",
+                        help=f"cache file (default: {PROGRESSION_FILENAME} next to {OUTPUT_PATH})")
+    parser.add_argument("--list", action="store_true", help="list every cached exercise")
+    parser.add_argument("--json", action="store_true", help="print the raw points as JSON")
+    args = parser.parse_args(argv)
+
+    if not args.exercise and not args.list:
+        parser.error("give an exercise name or --list")
+
+    cache_file = args.cache or (args.vault / OUTPUT_PATH).parent / PROGRESSION_FILENAME
+    if not cache_file.exists():
+        print(f"❌ No progression cache at {cache_file}; "
+              f"run backfill_last_weights.py --progression first")
+        sys.exit(1)
+    exercises = load_progression(cache_file)["exercises"]
+
+    if args.list:
+        for name, points in exercises.items():
+            print(f"  {name:40s} {len(points):>5} sessions  (last {points[-1]['date']})")
+        return
+
+    names = load_exercise_names(args.vault)
+    target = names.canonical(args.exercise)
+    points = []
+    for name, series in exercises.items():
+        if names.canonical(name) == target:
+            points.extend(series)
+    if not points:
+        print(f"❌ {args.exercise!r} not in {cache_file}")
+        sys.exit(1)
+    # One point per file, even when several cached spellings logged it
+    points.sort(key=lambda pt: (pt["date"], pt["file"]))
+    merged = []
+    for pt in points:
+        if merged and merged[-1]["file"] == pt["file"]:
+            merge_summary_points(merged[-1], pt)
+        else:
+            merged.append(dict(pt))
+    points = merged
+
+    if args.json:
+        print(json.dumps(points, indent=2, ensure_ascii=False))
+        return
+    print(f"{'date':10}  {'max lb':>10}  {'max reps':>8}  {'total reps':>10}  {'sets':>4}")
+    for pt in points:
+        weight = "bodyweight" if pt["maxWeightLb"] is None else f"{pt['maxWeightLb']:g}"
+        print(f"{pt['date']:10}  {weight:>10}  {pt['maxReps']:>8}  {pt['totalReps']:>10}  {pt['sets']:>4}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+reconcile_journals.py
+
+Makes sure every workout file is embedded in its day's journal note, the
+way the app does on save: `![[workouts/2026-02-13-chest]]` appended to
+journals/2026-Feb-13.md, created from templates/journal-t.md if missing.
+For repairing imported sessions or embeds lost to sync conflicts.
+
+One directory pass over workouts/ and one over journals/ build the
+date → workout files and date → journal maps; only journals for days with
+workouts are read, and only those missing an embed are (atomically)
+rewritten. An embed counts as present if any `![[…]]` in the note points
+at the workout file's name, with or without folder or `.md`.
+
+Usage:
+    python3 reconcile_journals.py [vault_path] [--dry-run] [--recursive]
+
+Default vault path: ~/Documents/Onyx
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sys
+from pathlib import Path
+
+from backfill_last_weights import (
+    DEFAULT_VAULT,
+    TEMPLATES_FOLDER,
+    WORKOUTS_FOLDER,
+    dedupe_workout_files,
+    scan_workout_files,
+    write_if_changed,
+)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+JOURNALS_FOLDER = "journals"
+JOURNAL_TEMPLATE = "journal-t.md"
+
+# Daily note filenames use MarkdownWriter.dailyNoteFilename's yyyy-MMM-dd
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+JOURNAL_RE = re.compile(r"(\d{4})-([A-Z][a-z]{2})-(\d{2})\.md$")
+EMBED_RE = re.compile(r"!\[\[([^\]|#]+)")
+
+# ── Maps ──────────────────────────────────────────────────────────────────────
+
+def journal_filename(date_str: str) -> str:
+    """2026-02-13 → 2026-Feb-13.md"""
+    year, month, day = date_str.split("-")
+    return f"{year}-{MONTHS[int(month) - 1]}-{day}.md"
+
+
+def scan_journals(journals_dir: Path) -> dict[str, Path]:
+    """{ ISO date: path } for every yyyy-MMM-dd.md note, in one scandir pass."""
+    journals = {}
+    if not journals_dir.is_dir():
+        return journals
+    with os.scandir(journals_dir) as it:
+        for entry in it:
+            m = JOURNAL_RE.match(entry.name)
+            if m and m.group(2) in MONTHS and entry.is_file():
+                month = MONTHS.index(m.group(2)) + 1
+                journals[f"{m.group(1)}-{month:02d}-{m.group(3)}"] = Path(entry.path)
+    return journals
+
+
+def workout_embeds(vault: Path, recursive: bool = False) -> dict[str, list[str]]:
+    """{ ISO date: [embed target, …] } — vault-relative paths without `.md`."""
+    by_date: dict[str, list[str]] = {}
+    scanned, _ = dedupe_workout_files(scan_workout_files(vault / WORKOUTS_FOLDER, recursive))
+    for date_str, path, _ in scanned:
+        target = path.relative_to(vault).with_suffix("").as_posix()
+        by_date.setdefault(date_str, []).append(target)
+    return by_date
+
+
+def embedded_names(text: str) -> set[str]:
+    """Basenames (without `.md`) of every `![[…]]` embed in a note."""
+    return {m.group(1).strip().rsplit("/", 1)[-1].removesuffix(".md")
+            for m in EMBED_RE.finditer(text)}
+
+
+def append_embed(note: str, target: str) -> str:
+    """Same layout as MarkdownWriter.appendEmbedIfNeeded."""
+    if note and not note.endswith("\n"):
+        note += "\n"
+    return note + f"\n![[{target}]]\n"
+
+# ── Reconcile ─────────────────────────────────────────────────────────────────
+
+def plan_updates(vault: Path, recursive: bool = False) -> list[tuple[Path, str, str, list[str]]]:
+    """
+    Journals that need embeds, as (path, old_text, new_text, added targets),
+    oldest first; a day's embeds are added in filename order. old_text is ""
+    for notes that don't exist yet.
+    """
+    journals_dir = vault / JOURNALS_FOLDER
+    journals = scan_journals(journals_dir)
+    template_file = vault / TEMPLATES_FOLDER / JOURNAL_TEMPLATE
+    template = None
+
+    updates = []
+    for date_str, targets in sorted(workout_embeds(vault, recursive).items()):
+        path = journals.get(date_str)
+        if path is not None:
+            old = path.read_text(encoding="utf-8")
+            note = old
+        else:
+            if template is None:
+                template = (template_file.read_text(encoding="utf-8")
+                            if template_file.is_file() else "")
+            path = journals_dir / journal_filename(date_str)
+            old, note = "", template
+
+        present = embedded_names(note)
+        added = sorted(t for t in targets if t.rsplit("/", 1)[-1] not in present)
+        if not added:
+            continue
+        for target in added:
+            note = append_embed(note, target)
+        updates.append((path, old, note, added))
+    return updates
+
+
+def print_diff(vault: Path, path: Path, old: str, new: str) -> None:
+    rel = path.relative_to(vault).as_posix()
+    sys.stdout.writelines(difflib.unified_diff(
+        old.splitlines(keepends=True), new.splitlines(keepends=True),
+        fromfile="/dev/null" if not old else f"a/{rel}", tofile=f"b/{rel}",
+    ))
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Add missing workout embeds to daily journal notes."
+    )
+    parser.add_argument("vault", nargs="?", type=Path, default=DEFAULT_VAULT,
+                        help=f"vault path (default: {DEFAULT_VAULT})")
+    parser.add_argument("--dry-run", "-n", action="store_true",
+                        help="print a unified diff of the changes instead of writing")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="also scan subfolders of workouts/")
+    args = parser.parse_args(argv)
+
+    if not (args.vault / WORKOUTS_FOLDER).exists():
+        print(f"❌ Workouts folder not found: {args.vault / WORKOUTS_FOLDER}")
+        sys.exit(1)
+
+    updates = plan_updates(args.vault, args.recursive)
+    created = sum(1 for path, _, _, _ in updates if not path.exists())
+    embeds = sum(len(added) for _, _, _, added in updates)
+
+    if args.dry_run:
+        for path, old, new, _ in updates:
+            print_diff(args.vault, path, old, new)
+        print(f"\n🔍 Dry run: would update {len(updates)} journals "
+              f"({created} new), adding {embeds} embeds")
+        return
+
+    for path, _, new, added in updates:
+        write_if_changed(path, new.encode("utf-8"))
+        print(f"  📓 {path.name} ← {', '.join(t.rsplit('/', 1)[-1] for t in added)}")
+    print(f"\n✅ Updated {len(updates)} journals ({created} new), added {embeds} embeds")
+
+
+if __name__ == "__main__":
+    main()